@@ -0,0 +1,80 @@
+import time
+from typing import Dict, Any, Optional
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for an upstream dependency.
+
+    closed    -> calls pass; `failure_threshold` consecutive failures trip it open
+    open      -> calls are rejected immediately for `recovery_timeout` seconds
+    half_open -> up to `half_open_max_calls` probes pass; one success closes it, one failure reopens it
+    """
+
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float, half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.half_open_in_flight = 0
+        self.trips = 0
+        self.rejected = 0
+
+    def allow_request(self) -> bool:
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self.state = STATE_HALF_OPEN
+            self.half_open_in_flight = 0
+
+        if self.state == STATE_HALF_OPEN:
+            if self.half_open_in_flight >= self.half_open_max_calls:
+                self.rejected += 1
+                return False
+            self.half_open_in_flight += 1
+
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        if self.state == STATE_HALF_OPEN:
+            self.state = STATE_CLOSED
+            self.half_open_in_flight = 0
+            print(f"✅ Circuit '{self.name}' closed after successful probe")
+
+    def record_abandoned(self):
+        """A permitted call ended with neither outcome (e.g. cancelled): free its probe slot"""
+        if self.state == STATE_HALF_OPEN and self.half_open_in_flight > 0:
+            self.half_open_in_flight -= 1
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._trip()
+
+    def _trip(self):
+        if self.state != STATE_OPEN:
+            self.trips += 1
+            print(f"❌ Circuit '{self.name}' opened after {self.consecutive_failures} consecutive failures")
+        self.state = STATE_OPEN
+        self.opened_at = time.monotonic()
+        self.half_open_in_flight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout_seconds": self.recovery_timeout,
+        }
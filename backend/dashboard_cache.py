@@ -0,0 +1,28 @@
+import os
+from typing import Optional, Dict, Any
+from ttl_cache import TTLCache
+
+# Per-user cache of the database-backed part of /api/dashboard-data (counts, winnings, rank,
+# recent tournaments). Registration and match writes invalidate it; anything else is seen after expiry.
+DASHBOARD_CACHE_TTL_SECONDS = float(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", 15))
+DASHBOARD_CACHE_MAX_ENTRIES = int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", 10000))
+
+_dashboard_cache = TTLCache(maxsize=DASHBOARD_CACHE_MAX_ENTRIES, ttl_seconds=DASHBOARD_CACHE_TTL_SECONDS)
+
+
+def get_cached_dashboard(user_id: str) -> Optional[Dict[str, Any]]:
+    return _dashboard_cache.get(user_id)
+
+
+def cache_dashboard(user_id: str, summary: Dict[str, Any]):
+    _dashboard_cache.set(user_id, summary)
+
+
+def invalidate_dashboard(*user_ids: str):
+    """Call after writing a registration or match result for these users"""
+    for user_id in user_ids:
+        _dashboard_cache.invalidate(user_id)
+
+
+def get_dashboard_cache_stats() -> Dict[str, Any]:
+    return _dashboard_cache.stats()
@@ -0,0 +1,77 @@
+import os
+from typing import Optional
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+# Load environment variables
+load_dotenv()
+
+# Connection configuration
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db")
+MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "tournament_db")
+
+# Pool and timeout configuration (milliseconds for timeouts)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 10))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", 60000))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", 5000))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", 5000))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", 5000))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", 10000))
+
+_client: Optional[AsyncIOMotorClient] = None
+
+
+def get_client() -> AsyncIOMotorClient:
+    """
+    Return the shared Motor client, creating it on first use.
+    Motor binds to the running event loop lazily, so this is safe to call at import time.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncIOMotorClient(
+            MONGO_URL,
+            maxPoolSize=MONGO_MAX_POOL_SIZE,
+            minPoolSize=MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+            socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+        )
+    return _client
+
+
+def get_database() -> AsyncIOMotorDatabase:
+    return get_client()[MONGO_DB_NAME]
+
+
+async def ping() -> bool:
+    """Round-trip to the server; used by the health check and at startup."""
+    try:
+        await get_client().admin.command("ping")
+        return True
+    except Exception as e:
+        print(f"❌ Database ping failed: {e}")
+        return False
+
+
+def close_client():
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+db = get_database()
+
+# Collections
+users_collection = db.users
+tournaments_collection = db.tournaments
+registrations_collection = db.registrations
+leaderboards_collection = db.leaderboards
+leaderboard_segments_collection = db.leaderboard_segments
+transactions_collection = db.transactions
+payments_collection = db.payments
+ai_predictions_collection = db.ai_predictions
+token_versions_collection = db.token_versions
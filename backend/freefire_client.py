@@ -0,0 +1,188 @@
+import os
+import asyncio
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+import httpx
+from ttl_cache import TTLCache
+from circuit_breaker import CircuitBreaker
+
+# Free Fire API configuration
+FREE_FIRE_API_BASE = "https://region-info-api.vercel.app"
+FREE_FIRE_API_TIMEOUT_SECONDS = float(os.getenv("FREE_FIRE_API_TIMEOUT_SECONDS", 10))
+FREE_FIRE_MAX_CONNECTIONS = int(os.getenv("FREE_FIRE_MAX_CONNECTIONS", 50))
+
+# Player-info cache: valid profiles live longer than "no such player" answers
+FREE_FIRE_CACHE_TTL_SECONDS = float(os.getenv("FREE_FIRE_CACHE_TTL_SECONDS", 300))
+FREE_FIRE_NEGATIVE_CACHE_TTL_SECONDS = float(os.getenv("FREE_FIRE_NEGATIVE_CACHE_TTL_SECONDS", 60))
+FREE_FIRE_CACHE_MAX_ENTRIES = int(os.getenv("FREE_FIRE_CACHE_MAX_ENTRIES", 20000))
+# Last-known-good profiles, served after the fresh entry expires or while the upstream is down
+FREE_FIRE_STALE_TTL_SECONDS = float(os.getenv("FREE_FIRE_STALE_TTL_SECONDS", 86400))
+
+# Circuit breaker around region-info-api
+FREE_FIRE_BREAKER_FAILURE_THRESHOLD = int(os.getenv("FREE_FIRE_BREAKER_FAILURE_THRESHOLD", 5))
+FREE_FIRE_BREAKER_RECOVERY_SECONDS = float(os.getenv("FREE_FIRE_BREAKER_RECOVERY_SECONDS", 30))
+FREE_FIRE_BREAKER_HALF_OPEN_CALLS = int(os.getenv("FREE_FIRE_BREAKER_HALF_OPEN_CALLS", 1))
+
+# Cached marker for a UID the upstream definitively rejected
+_INVALID_PLAYER = object()
+
+_client: Optional[httpx.AsyncClient] = None
+_player_cache = TTLCache(maxsize=FREE_FIRE_CACHE_MAX_ENTRIES, ttl_seconds=FREE_FIRE_CACHE_TTL_SECONDS)
+_stale_profiles = TTLCache(maxsize=FREE_FIRE_CACHE_MAX_ENTRIES, ttl_seconds=FREE_FIRE_STALE_TTL_SECONDS)
+_in_flight: Dict[Tuple[str, str], "asyncio.Future"] = {}
+_breaker = CircuitBreaker(
+    "region-info-api",
+    failure_threshold=FREE_FIRE_BREAKER_FAILURE_THRESHOLD,
+    recovery_timeout=FREE_FIRE_BREAKER_RECOVERY_SECONDS,
+    half_open_max_calls=FREE_FIRE_BREAKER_HALF_OPEN_CALLS,
+)
+_stats = {
+    "upstream_calls": 0,
+    "coalesced": 0,
+    "upstream_errors": 0,
+    "stale_served": 0,
+    "shed": 0,
+}
+
+
+class FreeFireUnavailable(Exception):
+    """The upstream is failing or the breaker is open and no stale profile is cached"""
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared keep-alive HTTP/2 client so lookups reuse one TLS connection"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=FREE_FIRE_API_BASE,
+            http2=True,
+            timeout=FREE_FIRE_API_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=FREE_FIRE_MAX_CONNECTIONS,
+                max_keepalive_connections=FREE_FIRE_MAX_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def parse_player_info(uid: str, region: str, data: dict) -> Optional[dict]:
+    """Map a region-info-api /player-info payload to our player profile shape"""
+    if "player_info" not in data:
+        return None
+    player_info = data["player_info"]
+    basic_info = player_info.get("basicInfo", {})
+    guild_info = player_info.get("guildInfo", {})
+    profile_info = player_info.get("profileInfo", {})
+
+    return {
+        "uid": uid,
+        "region": region.upper(),
+        "nickname": basic_info.get("nickname", "Unknown"),
+        "level": basic_info.get("level", 1),
+        "avatar_id": profile_info.get("avatarId", "102000007"),
+        "liked": basic_info.get("liked", 0),
+        "exp": basic_info.get("exp", 0),
+        "clan_name": guild_info.get("guildName", "No Guild"),
+        "clan_level": guild_info.get("guildLevel", 1),
+        "validated_at": datetime.utcnow().isoformat()
+    }
+
+
+async def _fetch_player_info(uid: str, region: str) -> Optional[dict]:
+    key = (uid, region.lower())
+    _stats["upstream_calls"] += 1
+    try:
+        response = await get_http_client().get(
+            "/player-info",
+            params={"uid": uid, "region": region.lower()}
+        )
+        if response.status_code >= 500 or response.status_code == 429:
+            raise httpx.HTTPStatusError("Upstream server error", request=response.request, response=response)
+        player = parse_player_info(uid, region, response.json()) if response.status_code == 200 else None
+    except Exception as e:
+        # Transport and server failures are not cached; the next caller retries upstream
+        _stats["upstream_errors"] += 1
+        _breaker.record_failure()
+        print(f"Free Fire API error: {e}")
+        raise FreeFireUnavailable(str(e)) from e
+
+    _breaker.record_success()
+    if player is not None:
+        _player_cache.set(key, player)
+        _stale_profiles.set(key, player)
+    else:
+        _player_cache.set(key, _INVALID_PLAYER, ttl_seconds=FREE_FIRE_NEGATIVE_CACHE_TTL_SECONDS)
+        # A definitive "no such player" outranks the last-known-good copy (deleted or banned UID)
+        _stale_profiles.invalidate(key)
+    return player
+
+
+def _lookup_done(key: Tuple[str, str], task: "asyncio.Future"):
+    _in_flight.pop(key, None)
+    if task.cancelled():
+        # Cancelled before recording an outcome (shutdown, client reset): don't hold a half-open probe slot forever
+        _breaker.record_abandoned()
+        return
+    # Background revalidations have no awaiter; consume the error so it isn't logged as unretrieved
+    task.exception()
+
+
+def _start_lookup(uid: str, region: str) -> Optional["asyncio.Future"]:
+    """Join the in-flight lookup for this key, or start one if the breaker allows it"""
+    key = (uid, region.lower())
+    task = _in_flight.get(key)
+    if task is not None:
+        _stats["coalesced"] += 1
+        return task
+    if not _breaker.allow_request():
+        return None
+    task = asyncio.ensure_future(_fetch_player_info(uid, region))
+    _in_flight[key] = task
+    task.add_done_callback(lambda done: _lookup_done(key, done))
+    return task
+
+
+async def validate_free_fire_uid(uid: str, region: str) -> Optional[dict]:
+    """
+    Validate Free Fire UID using the region info API (cached and coalesced per (uid, region)).
+    Returns None for an unknown UID; raises FreeFireUnavailable when the upstream can't answer.
+    """
+    key = (uid, region.lower())
+    cached = _player_cache.get(key)
+    if cached is _INVALID_PLAYER:
+        return None
+    if cached is not None:
+        return dict(cached)
+
+    stale = _stale_profiles.get(key)
+    if stale is not None:
+        # Stale-while-revalidate: answer now, refresh in the background when the breaker permits
+        _stats["stale_served"] += 1
+        _start_lookup(uid, region)
+        return dict(stale)
+
+    task = _start_lookup(uid, region)
+    if task is None:
+        _stats["shed"] += 1
+        raise FreeFireUnavailable("Circuit open for region-info-api")
+
+    # Shield so one caller disconnecting doesn't cancel the lookup for everyone else
+    player = await asyncio.shield(task)
+    return dict(player) if player is not None else None
+
+
+def get_freefire_client_stats() -> Dict[str, Any]:
+    return {
+        **_stats,
+        "in_flight": len(_in_flight),
+        "cache": _player_cache.stats(),
+        "stale_cache": _stale_profiles.stats(),
+        "breaker": _breaker.stats(),
+    }
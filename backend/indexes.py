@@ -0,0 +1,183 @@
+import os
+import sys
+import argparse
+from typing import Any, Dict, List
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pagination import KEYSET_SORT, REGISTRATION_KEYSET_SORT
+
+# Indexes required by the query patterns in the API servers, keyed by collection name.
+# Names are explicit so re-running is idempotent and conflicts are easy to spot.
+INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        IndexModel([("user_id", ASCENDING)], unique=True, name="user_id_unique"),
+        IndexModel([("email", ASCENDING)], unique=True, name="email_1"),
+        IndexModel([("free_fire_uid", ASCENDING)], unique=True, name="free_fire_uid_1"),
+        # Admin listing keyset pagination
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+    ],
+    "tournaments": [
+        IndexModel([("tournament_id", ASCENDING)], unique=True, name="tournament_id_unique"),
+        # /api/tournaments filters by one of status/game_type/country and pages newest first
+        # on the (created_at, _id) keyset
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="status_created_at_id"),
+        IndexModel([("game_type", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="game_type_created_at_id"),
+        IndexModel([("country", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="country_created_at_id"),
+    ],
+    "registrations": [
+        # The only record of tournament membership, indexed both ways.
+        # Tournament -> players; also one registration per (tournament, user), which join/payment handlers rely on
+        IndexModel([("tournament_id", ASCENDING), ("user_id", ASCENDING)], unique=True, name="tournament_user_unique"),
+        # Player -> tournaments, newest first (dashboard, "my tournaments" keyset pages)
+        IndexModel([("user_id", ASCENDING), ("registered_at", DESCENDING), ("_id", DESCENDING)], name="user_registered_at_id"),
+    ],
+    "transactions": [
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)], name="user_created_at"),
+    ],
+    "payments": [
+        IndexModel([("order_id", ASCENDING)], unique=True, name="order_id_unique"),
+        IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)], name="user_created_at"),
+        IndexModel([("tournament_id", ASCENDING)], name="tournament_id_1"),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)], name="created_at_id"),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)], name="status_created_at_id"),
+    ],
+    "matches": [
+        IndexModel([("user_id", ASCENDING), ("match_date", DESCENDING)], name="user_match_date"),
+        IndexModel([("tournament_id", ASCENDING), ("user_id", ASCENDING)], name="tournament_user"),
+    ],
+    "leaderboards": [
+        IndexModel([("user_id", ASCENDING)], name="user_id_1"),
+        # Top-N and "around me" range queries; user_id breaks ties like the in-memory rank index
+        IndexModel([("points", DESCENDING), ("user_id", ASCENDING)], name="points_user_id"),
+        # Legacy server orders by the stored rank
+        IndexModel([("rank", ASCENDING)], name="rank_1"),
+    ],
+    "leaderboard_segments": [
+        # One row per player per board; match results upsert on this key
+        IndexModel([("board_id", ASCENDING), ("user_id", ASCENDING)], unique=True, name="board_user_unique"),
+        # Serving a board is one range scan in rank order
+        IndexModel([("board_id", ASCENDING), ("points", DESCENDING), ("user_id", ASCENDING)], name="board_points_user_id"),
+    ],
+}
+
+# Representative query shape per route, used by the `explain` command.
+# Placeholder values only need to have the right type for the planner.
+ROUTE_QUERIES: List[Dict[str, Any]] = [
+    {"route": "GET /api/auth/me", "collection": "users", "filter": {"user_id": "sample"}},
+    {"route": "POST /api/auth/login (email)", "collection": "users", "filter": {"email": "sample@example.com"}},
+    {"route": "POST /api/auth/login (uid)", "collection": "users", "filter": {"free_fire_uid": "12345678"}},
+    {"route": "GET /api/tournaments", "collection": "tournaments", "filter": {}, "sort": KEYSET_SORT},
+    {"route": "GET /api/tournaments?status=", "collection": "tournaments", "filter": {"status": "live"}, "sort": KEYSET_SORT},
+    {"route": "GET /api/tournaments?game_type=", "collection": "tournaments", "filter": {"game_type": "free_fire"}, "sort": KEYSET_SORT},
+    {"route": "GET /api/tournaments?country=", "collection": "tournaments", "filter": {"country": "India"}, "sort": KEYSET_SORT},
+    {"route": "GET /api/admin/users", "collection": "users", "filter": {}, "sort": KEYSET_SORT},
+    {"route": "GET /api/admin/payments?status=", "collection": "payments", "filter": {"status": "success"}, "sort": KEYSET_SORT},
+    {"route": "GET /api/leaderboards", "collection": "leaderboards", "filter": {}, "sort": [("points", DESCENDING)]},
+    {"route": "GET /api/leaderboards (legacy)", "collection": "leaderboards", "filter": {}, "sort": [("rank", ASCENDING)]},
+    {"route": "GET /api/leaderboards?category=", "collection": "leaderboard_segments", "filter": {"board_id": "region:IND"}, "sort": [("points", DESCENDING), ("user_id", ASCENDING)]},
+    {"route": "GET /api/leaderboards/me (fallback)", "collection": "leaderboards", "filter": {"points": {"$gt": 1000}}, "sort": [("points", ASCENDING), ("user_id", DESCENDING)]},
+    {"route": "GET /api/live-stats (live count)", "collection": "tournaments", "filter": {"status": "live"}},
+    {"route": "GET /api/dashboard-data (registrations)", "collection": "registrations", "filter": {"user_id": "sample"}, "sort": [("registered_at", DESCENDING)]},
+    {"route": "GET /api/dashboard-data (tournaments)", "collection": "tournaments", "filter": {"tournament_id": {"$in": ["sample"]}}},
+    {"route": "tournament roster", "collection": "registrations", "filter": {"tournament_id": "sample"}},
+    {"route": "GET /api/dashboard-data (transactions)", "collection": "transactions", "filter": {"user_id": "sample"}, "sort": [("created_at", DESCENDING)]},
+    {"route": "GET /api/wallet/transactions", "collection": "transactions", "filter": {"user_id": "sample"}, "sort": [("created_at", DESCENDING)]},
+    {"route": "POST /api/tournaments/{id}/register", "collection": "registrations", "filter": {"tournament_id": "sample", "user_id": "sample"}},
+    {"route": "GET /api/user/tournaments", "collection": "registrations", "filter": {"user_id": "sample"}, "sort": REGISTRATION_KEYSET_SORT},
+    {"route": "GET /api/payments/{order_id}/status", "collection": "payments", "filter": {"order_id": "sample", "user_id": "sample"}},
+]
+
+
+def ensure_indexes(db) -> Dict[str, List[str]]:
+    """
+    Create every declared index on a pymongo Database; already-present indexes are a no-op.
+    A failure on one collection (e.g. existing duplicates blocking a unique index) is logged
+    and doesn't stop the others.
+    """
+    created = {}
+    for collection_name, models in INDEXES.items():
+        try:
+            created[collection_name] = db[collection_name].create_indexes(models)
+        except Exception as e:
+            print(f"❌ Failed to create indexes on {collection_name}: {e}")
+    print(f"✅ Indexes ensured on {len(created)}/{len(INDEXES)} collections")
+    return created
+
+
+async def ensure_indexes_async(db) -> Dict[str, List[str]]:
+    """Motor counterpart of ensure_indexes, meant to run as a background task after startup"""
+    created = {}
+    for collection_name, models in INDEXES.items():
+        try:
+            created[collection_name] = await db[collection_name].create_indexes(models)
+        except Exception as e:
+            print(f"❌ Failed to create indexes on {collection_name}: {e}")
+    print(f"✅ Indexes ensured on {len(created)}/{len(INDEXES)} collections")
+    return created
+
+
+def _winning_indexes(plan: Dict[str, Any]) -> List[str]:
+    names = []
+    if plan.get("indexName"):
+        names.append(plan["indexName"])
+    for child_key in ("inputStage", "queryPlan"):
+        if child_key in plan:
+            names.extend(_winning_indexes(plan[child_key]))
+    for child in plan.get("inputStages", []):
+        names.extend(_winning_indexes(child))
+    return names
+
+
+def _stages(plan: Dict[str, Any]) -> List[str]:
+    stages = [plan.get("stage", "?")]
+    for child_key in ("inputStage", "queryPlan"):
+        if child_key in plan:
+            stages.extend(_stages(plan[child_key]))
+    for child in plan.get("inputStages", []):
+        stages.extend(_stages(child))
+    return stages
+
+
+def explain_routes(db):
+    """Print the winning plan for each route's query shape and flag collection scans"""
+    for query in ROUTE_QUERIES:
+        cursor = db[query["collection"]].find(query["filter"])
+        if query.get("sort"):
+            cursor = cursor.sort(query["sort"])
+        explanation = cursor.limit(query.get("limit", 20)).explain()
+        plan = explanation["queryPlanner"]["winningPlan"]
+        stats = explanation.get("executionStats", {})
+        stages = _stages(plan)
+        marker = "❌" if "COLLSCAN" in stages or "SORT" in stages else "✅"
+        print(
+            f"{marker} {query['route']:<42} {' <- '.join(stages):<40} "
+            f"index={','.join(_winning_indexes(plan)) or '-'}  "
+            f"docs_examined={stats.get('totalDocsExamined', '?')}"
+        )
+
+
+def main():
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Manage MongoDB indexes for the tournament API")
+    parser.add_argument("command", choices=["ensure", "explain", "list"])
+    args = parser.parse_args()
+
+    mongo_url = os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db")
+    db = MongoClient(mongo_url)[os.getenv("MONGO_DB_NAME", "tournament_db")]
+
+    if args.command == "ensure":
+        ensure_indexes(db)
+    elif args.command == "explain":
+        explain_routes(db)
+    else:
+        for collection_name, models in INDEXES.items():
+            for model in models:
+                print(f"{collection_name:<14} {model.document['name']:<26} {dict(model.document['key'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import random
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Order key: highest points first, user_id breaks ties so every player has one exact position
+OrderKey = Tuple[float, str]
+
+_MAX_LEVEL = 32
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Optional[OrderKey], level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        # width[i] = how many level-0 steps next[i] skips; lets us count positions in O(log n)
+        self.width: List[int] = [1] * level
+
+
+class IndexableSkipList:
+    """Sorted set of OrderKeys with O(log n) insert, remove, position-of and select-by-position"""
+
+    def __init__(self):
+        self.head = _Node(None, _MAX_LEVEL)
+        self.level = 1
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def _random_level() -> int:
+        level = 1
+        while level < _MAX_LEVEL and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _search_path(self, key: OrderKey):
+        update = [self.head] * _MAX_LEVEL
+        position = [0] * _MAX_LEVEL
+        node, steps = self.head, 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].key < key:
+                steps += node.width[i]
+                node = node.next[i]
+            update[i], position[i] = node, steps
+        return update, position
+
+    def insert(self, key: OrderKey):
+        update, position = self._search_path(key)
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i], position[i] = self.head, 0
+                self.head.width[i] = self.size + 1
+            self.level = level
+
+        node = _Node(key, level)
+        rank = position[0]
+        for i in range(level):
+            node.next[i] = update[i].next[i]
+            update[i].next[i] = node
+            skipped = rank - position[i]
+            node.width[i] = update[i].width[i] - skipped
+            update[i].width[i] = skipped + 1
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+        self.size += 1
+
+    def remove(self, key: OrderKey) -> bool:
+        update, _ = self._search_path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return False
+        for i in range(self.level):
+            if update[i].next[i] is node:
+                update[i].width[i] += node.width[i] - 1
+                update[i].next[i] = node.next[i]
+            else:
+                update[i].width[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return True
+
+    def position_of(self, key: OrderKey) -> Optional[int]:
+        """0-based position of `key`, or None if absent"""
+        update, position = self._search_path(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            return None
+        return position[0]
+
+    def slice(self, start: int, count: int) -> List[OrderKey]:
+        """Keys at positions [start, start + count)"""
+        if start < 0:
+            count += start
+            start = 0
+        if count <= 0 or start >= self.size:
+            return []
+        node, steps = self.head, -1
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and steps + node.width[i] <= start:
+                steps += node.width[i]
+                node = node.next[i]
+        keys = []
+        while node is not None and len(keys) < count:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class LeaderboardIndex:
+    """
+    In-memory materialized leaderboard.
+    Rank-of-user, top-N and players-around-me are O(log n + k). Rank is the 1-based position
+    by points (ties ordered by user_id). Thread-safe so sync handlers can share it.
+    """
+
+    def __init__(self):
+        self._order = IndexableSkipList()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        # False until the first rebuild: callers should fall back to Mongo meanwhile
+        self.ready = False
+        # Writes made while a rebuild is reading its snapshot, replayed onto the new index at swap time
+        self._journal: Optional[List[Tuple[str, Any]]] = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _key(entry: Dict[str, Any]) -> OrderKey:
+        return (-float(entry.get("points", 0) or 0), entry["user_id"])
+
+    def upsert(self, entry: Dict[str, Any]):
+        """Insert or replace a player's row (any leaderboard document shape with user_id and points)"""
+        entry = {k: v for k, v in entry.items() if k not in ("_id", "rank")}
+        with self._lock:
+            previous = self._entries.get(entry["user_id"])
+            if previous is not None:
+                self._order.remove(self._key(previous))
+            self._entries[entry["user_id"]] = entry
+            self._order.insert(self._key(entry))
+            if self._journal is not None:
+                self._journal.append(("upsert", entry))
+
+    def update_fields(self, user_id: str, fields: Dict[str, Any]):
+        """Apply a partial update (e.g. after a $set/$inc on the document) and re-rank"""
+        with self._lock:
+            previous = self._entries.get(user_id)
+            if previous is None:
+                return
+            self.upsert({**previous, **fields})
+
+    def remove(self, user_id: str):
+        with self._lock:
+            previous = self._entries.pop(user_id, None)
+            if previous is not None:
+                self._order.remove(self._key(previous))
+            if self._journal is not None:
+                self._journal.append(("remove", user_id))
+
+    def begin_rebuild(self):
+        """Start recording writes; call before reading the snapshot that will be passed to rebuild()"""
+        with self._lock:
+            self._journal = []
+
+    def abort_rebuild(self):
+        with self._lock:
+            self._journal = None
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]]):
+        fresh = LeaderboardIndex()
+        for entry in entries:
+            fresh.upsert(entry)
+        with self._lock:
+            # Writes since begin_rebuild() may be missing from the snapshot; replaying is idempotent
+            for operation, value in self._journal or ():
+                if operation == "upsert":
+                    fresh.upsert(value)
+                else:
+                    fresh.remove(value)
+            self._journal = None
+            self._order, self._entries = fresh._order, fresh._entries
+            self.ready = True
+
+    def _rows(self, keys: List[OrderKey], first_rank: int) -> List[Dict[str, Any]]:
+        return [
+            {**self._entries[user_id], "rank": first_rank + offset}
+            for offset, (_, user_id) in enumerate(keys)
+        ]
+
+    def rank_of(self, user_id: str) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            return self._order.position_of(self._key(entry)) + 1
+
+    def top(self, limit: int, offset: int = 0) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self._rows(self._order.slice(offset, limit), offset + 1)
+
+    def around(self, user_id: str, window: int) -> Tuple[Optional[int], List[Dict[str, Any]]]:
+        """The player's rank plus up to `window` players above and below them"""
+        with self._lock:
+            rank = self.rank_of(user_id)
+            if rank is None:
+                return None, []
+            start = max(0, rank - 1 - window)
+            keys = self._order.slice(start, (rank - 1 - start) + window + 1)
+            return rank, self._rows(keys, start + 1)
@@ -0,0 +1,105 @@
+import os
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+from pymongo import DeleteOne, UpdateOne
+
+# Background sync interval for the level/avatar copies kept on leaderboard rows
+LEADERBOARD_PROFILE_SYNC_SECONDS = float(os.getenv("LEADERBOARD_PROFILE_SYNC_SECONDS", 600))
+
+DEFAULT_AVATAR = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+
+# Only what profile_fields reads; users documents also carry the full Free Fire payload
+USER_PROFILE_PROJECTION = {"_id": 0, "user_id": 1, "free_fire_data.level": 1, "free_fire_data.profile_pic": 1}
+
+
+def profile_fields(user: Dict[str, Any]) -> Dict[str, Any]:
+    """The user fields copied onto their leaderboard rows"""
+    ff_data = user.get("free_fire_data") or {}
+    return {
+        "level": ff_data.get("level", 0),
+        "avatar": ff_data.get("profile_pic") or DEFAULT_AVATAR,
+    }
+
+
+def attach_profiles(users_collection, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Make sure every row has level/avatar. Rows the sync hasn't reached yet are filled
+    from one $in fetch; rows whose user no longer exists are dropped.
+    """
+    missing = [entry["user_id"] for entry in entries if "level" not in entry or "avatar" not in entry]
+    if not missing:
+        return entries
+
+    users = {
+        user["user_id"]: user
+        for user in users_collection.find({"user_id": {"$in": missing}}, USER_PROFILE_PROJECTION)
+    }
+    attached = []
+    for entry in entries:
+        if "level" in entry and "avatar" in entry:
+            attached.append(entry)
+        elif entry["user_id"] in users:
+            attached.append({**entry, **profile_fields(users[entry["user_id"]])})
+    return attached
+
+
+def refresh_user_profile(leaderboards_collection, user: Dict[str, Any]):
+    """Push one user's current level/avatar to their leaderboard rows (call after a profile change)"""
+    leaderboards_collection.update_many(
+        {"user_id": user["user_id"]},
+        {"$set": {**profile_fields(user), "updated_at": datetime.utcnow()}}
+    )
+
+
+def sync_leaderboard_profiles(db, batch_size: int = 500) -> Dict[str, int]:
+    """
+    Re-copy level/avatar from users onto every leaderboard row and remove rows whose user
+    no longer exists. One $in fetch and one bulk write per batch; rows already in sync
+    aren't rewritten. Returns the number of rows updated and removed.
+    """
+    totals = {"updated": 0, "removed": 0}
+    rows = db.leaderboards.find({}, {"_id": 1, "user_id": 1, "level": 1, "avatar": 1}).batch_size(batch_size)
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            _sync_batch(db, batch, totals)
+            batch = []
+    if batch:
+        _sync_batch(db, batch, totals)
+    return totals
+
+
+def _sync_batch(db, rows: List[Dict[str, Any]], totals: Dict[str, int]):
+    users = {
+        user["user_id"]: user
+        for user in db.users.find({"user_id": {"$in": list({row["user_id"] for row in rows})}}, USER_PROFILE_PROJECTION)
+    }
+    operations = []
+    for row in rows:
+        user = users.get(row["user_id"])
+        if user is None:
+            # Deleted player: filled-in profile fields would otherwise keep the row on the board
+            operations.append(DeleteOne({"_id": row["_id"]}))
+            totals["removed"] += 1
+            continue
+        fields = profile_fields(user)
+        if any(row.get(name) != value for name, value in fields.items()):
+            operations.append(UpdateOne({"_id": row["_id"]}, {"$set": fields}))
+            totals["updated"] += 1
+    if operations:
+        db.leaderboards.bulk_write(operations, ordered=False)
+
+
+async def run_profile_sync_loop(db):
+    """Periodic sync for profile changes made outside the API (seeders, other servers, direct edits)"""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            totals = await loop.run_in_executor(None, sync_leaderboard_profiles, db)
+            if totals["updated"] or totals["removed"]:
+                print(f"✅ Synced level/avatar on {totals['updated']} leaderboard rows, removed {totals['removed']} for deleted users")
+        except Exception as e:
+            print(f"Leaderboard profile sync error: {e}")
+        await asyncio.sleep(LEADERBOARD_PROFILE_SYNC_SECONDS)
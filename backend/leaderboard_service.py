@@ -0,0 +1,51 @@
+import os
+import asyncio
+import time
+from typing import Dict, Any
+from database import leaderboards_collection
+from leaderboard_index import LeaderboardIndex
+
+# Full rebuild interval; picks up leaderboard writes made outside this process (seeders, other servers)
+LEADERBOARD_REBUILD_SECONDS = float(os.getenv("LEADERBOARD_REBUILD_SECONDS", 300))
+
+LEADERBOARD_PROJECTION = {"_id": 0, "rank": 0}
+
+leaderboard_index = LeaderboardIndex()
+_last_rebuild = {"at": None, "seconds": 0.0}
+
+
+async def rebuild_leaderboard_index():
+    """Reload every leaderboard row from Mongo and swap in a fresh index"""
+    started = time.perf_counter()
+    # Upserts made while the snapshot is read and built are replayed onto it before the swap
+    leaderboard_index.begin_rebuild()
+    try:
+        entries = await leaderboards_collection.find({}, LEADERBOARD_PROJECTION).to_list(length=None)
+        # Building is CPU-bound; keep it off the event loop thread
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, leaderboard_index.rebuild, entries)
+    except BaseException:
+        leaderboard_index.abort_rebuild()
+        raise
+    _last_rebuild["at"] = time.time()
+    _last_rebuild["seconds"] = round(time.perf_counter() - started, 3)
+    print(f"✅ Leaderboard index rebuilt with {len(leaderboard_index)} players in {_last_rebuild['seconds']}s")
+
+
+async def run_rebuild_loop():
+    while True:
+        try:
+            await rebuild_leaderboard_index()
+        except Exception as e:
+            print(f"Leaderboard rebuild error: {e}")
+        await asyncio.sleep(LEADERBOARD_REBUILD_SECONDS)
+
+
+def get_leaderboard_index_stats() -> Dict[str, Any]:
+    return {
+        "ready": leaderboard_index.ready,
+        "players": len(leaderboard_index),
+        "last_rebuild_at": _last_rebuild["at"],
+        "last_rebuild_seconds": _last_rebuild["seconds"],
+        "rebuild_interval_seconds": LEADERBOARD_REBUILD_SECONDS,
+    }
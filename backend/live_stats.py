@@ -0,0 +1,168 @@
+import os
+import time
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, Optional
+from ttl_cache import TTLCache
+
+# Counters live in one document (the shape scripts/seed_database.py writes). Handlers bump it
+# with $inc as users, tournaments and registrations change; a periodic reconciliation recounts
+# and corrects drift, so every counter here needs a bump on each write path or it reports drift.
+STATS_ID = "global_stats"
+COUNTER_FIELDS = ("total_tournaments", "active_tournaments", "total_users", "total_registrations", "total_prize_pool")
+
+LIVE_STATS_CACHE_SECONDS = float(os.getenv("LIVE_STATS_CACHE_SECONDS", 5))
+LIVE_STATS_RECONCILE_SECONDS = float(os.getenv("LIVE_STATS_RECONCILE_SECONDS", 300))
+
+_cache = TTLCache(maxsize=1, ttl_seconds=LIVE_STATS_CACHE_SECONDS)
+_reconcile_state = {"at": None, "drift": {}}
+
+
+def tournament_deltas(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Counter changes for a tournament going from `before` to `after`.
+    Pass None as `before` for a create and as `after` for a delete.
+    """
+    def contribution(tournament):
+        if tournament is None:
+            return {"total_tournaments": 0, "active_tournaments": 0, "total_prize_pool": 0}
+        return {
+            "total_tournaments": 1,
+            "active_tournaments": 1 if tournament.get("status") == "live" else 0,
+            "total_prize_pool": tournament.get("prize_pool", 0) or 0,
+        }
+
+    old, new = contribution(before), contribution(after)
+    return {field: new[field] - old[field] for field in old if new[field] != old[field]}
+
+
+def _increment(deltas: Dict[str, float]) -> Dict[str, Any]:
+    return {"$inc": deltas, "$set": {"updated_at": datetime.utcnow()}}
+
+
+def bump_live_stats(stats_collection, **deltas):
+    """Apply counter deltas (pymongo)"""
+    if not deltas:
+        return
+    stats_collection.update_one({"stats_id": STATS_ID}, _increment(deltas), upsert=True)
+    _cache.invalidate(STATS_ID)
+
+
+async def bump_live_stats_async(stats_collection, **deltas):
+    """Motor counterpart of bump_live_stats"""
+    if not deltas:
+        return
+    await stats_collection.update_one({"stats_id": STATS_ID}, _increment(deltas), upsert=True)
+    _cache.invalidate(STATS_ID)
+
+
+def _stats_document(total_tournaments, active_tournaments, total_users, total_registrations, prize_pool_result):
+    total_prize_pool = prize_pool_result[0]["total"] if prize_pool_result else 0
+    return {
+        "stats_id": STATS_ID,
+        "total_tournaments": total_tournaments,
+        "active_tournaments": active_tournaments,
+        "total_users": total_users,
+        "total_registrations": total_registrations,
+        "total_prize_pool": total_prize_pool,
+        "live_matches": active_tournaments,
+        "active_players": total_users,
+        "updated_at": datetime.utcnow(),
+    }
+
+
+PRIZE_POOL_PIPELINE = [{"$group": {"_id": None, "total": {"$sum": "$prize_pool"}}}]
+
+
+def _record_reconcile(previous: Optional[Dict[str, Any]], fresh: Dict[str, Any]) -> Dict[str, float]:
+    drift = {
+        field: fresh[field] - (previous or {}).get(field, 0)
+        for field in COUNTER_FIELDS
+        if fresh[field] != (previous or {}).get(field, 0)
+    }
+    _reconcile_state["at"] = time.time()
+    _reconcile_state["drift"] = drift
+    _cache.set(STATS_ID, fresh)
+    if drift and previous is not None:
+        print(f"⚠️ Live stats drift corrected: {drift}")
+    return drift
+
+
+def reconcile_live_stats(db) -> Dict[str, float]:
+    """Recount everything from the source collections and overwrite the counters (pymongo)"""
+    fresh = _stats_document(
+        db.tournaments.count_documents({}),
+        db.tournaments.count_documents({"status": "live"}),
+        db.users.count_documents({}),
+        db.registrations.count_documents({}),
+        list(db.tournaments.aggregate(PRIZE_POOL_PIPELINE)),
+    )
+    previous = db.live_stats.find_one_and_replace({"stats_id": STATS_ID}, fresh, upsert=True)
+    return _record_reconcile(previous, fresh)
+
+
+async def reconcile_live_stats_async(db) -> Dict[str, float]:
+    """Motor counterpart of reconcile_live_stats"""
+    counts = await asyncio.gather(
+        db.tournaments.count_documents({}),
+        db.tournaments.count_documents({"status": "live"}),
+        db.users.count_documents({}),
+        db.registrations.count_documents({}),
+        db.tournaments.aggregate(PRIZE_POOL_PIPELINE).to_list(length=1),
+    )
+    fresh = _stats_document(*counts)
+    previous = await db.live_stats.find_one_and_replace({"stats_id": STATS_ID}, fresh, upsert=True)
+    return _record_reconcile(previous, fresh)
+
+
+def read_live_stats(db) -> Dict[str, Any]:
+    """Cached counter document; reconciles first if it doesn't exist yet (pymongo)"""
+    stats = _cache.get(STATS_ID)
+    if stats is None:
+        stats = db.live_stats.find_one({"stats_id": STATS_ID}, {"_id": 0})
+        if stats is None:
+            reconcile_live_stats(db)
+            return _cache.get(STATS_ID)
+        _cache.set(STATS_ID, stats)
+    return stats
+
+
+async def read_live_stats_async(db) -> Dict[str, Any]:
+    """Motor counterpart of read_live_stats"""
+    stats = _cache.get(STATS_ID)
+    if stats is None:
+        stats = await db.live_stats.find_one({"stats_id": STATS_ID}, {"_id": 0})
+        if stats is None:
+            await reconcile_live_stats_async(db)
+            return _cache.get(STATS_ID)
+        _cache.set(STATS_ID, stats)
+    return stats
+
+
+async def run_reconcile_loop(db):
+    while True:
+        try:
+            await reconcile_live_stats_async(db)
+        except Exception as e:
+            print(f"Live stats reconcile error: {e}")
+        await asyncio.sleep(LIVE_STATS_RECONCILE_SECONDS)
+
+
+async def run_reconcile_loop_sync(db):
+    """Same loop for a pymongo database; each reconcile runs in the default executor"""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.run_in_executor(None, reconcile_live_stats, db)
+        except Exception as e:
+            print(f"Live stats reconcile error: {e}")
+        await asyncio.sleep(LIVE_STATS_RECONCILE_SECONDS)
+
+
+def get_live_stats_cache_stats() -> Dict[str, Any]:
+    return {
+        "cache": _cache.stats(),
+        "last_reconcile_at": _reconcile_state["at"],
+        "last_drift": _reconcile_state["drift"],
+        "reconcile_interval_seconds": LIVE_STATS_RECONCILE_SECONDS,
+    }
@@ -0,0 +1,134 @@
+import os
+import time
+import asyncio
+from typing import Any, Dict, Optional, Set
+from live_stats import read_live_stats_async
+
+# One producer reads the counters and fans changes out to every subscriber; connections never query
+LIVE_STATS_PUSH_SECONDS = float(os.getenv("LIVE_STATS_PUSH_SECONDS", 2))
+LIVE_STATS_HEARTBEAT_SECONDS = float(os.getenv("LIVE_STATS_HEARTBEAT_SECONDS", 30))
+LIVE_STATS_MAX_SUBSCRIBERS = int(os.getenv("LIVE_STATS_MAX_SUBSCRIBERS", 10000))
+
+
+def public_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Counter document -> the fields /api/live-stats exposes"""
+    return {
+        "total_tournaments": stats.get("total_tournaments", 0),
+        "active_players": stats.get("total_users", 0),
+        "live_matches": stats.get("active_tournaments", 0),
+        "total_prize_pool": stats.get("total_prize_pool", 0),
+    }
+
+
+def _merge(older: Optional[Dict[str, Any]], newer: Dict[str, Any]) -> Dict[str, Any]:
+    if older is None:
+        return newer
+    kinds = {older["type"], newer["type"]}
+    kind = "snapshot" if "snapshot" in kinds else "delta" if "delta" in kinds else "heartbeat"
+    return {"type": kind, "data": {**older.get("data", {}), **newer.get("data", {})}, "sent_at": newer["sent_at"]}
+
+
+class SubscriberLimitReached(Exception):
+    pass
+
+
+class Subscription:
+    """
+    One connection's mailbox. It holds at most one pending message: when the client is slower
+    than the broadcast rate, undelivered deltas are merged instead of queued, so memory per
+    connection stays constant and the client jumps straight to the newest state.
+    """
+
+    __slots__ = ("_pending", "_ready", "coalesced")
+
+    def __init__(self):
+        self._pending: Optional[Dict[str, Any]] = None
+        self._ready = asyncio.Event()
+        self.coalesced = 0
+
+    def offer(self, message: Dict[str, Any]):
+        if self._pending is not None:
+            self.coalesced += 1
+        self._pending = _merge(self._pending, message)
+        self._ready.set()
+
+    async def next(self) -> Dict[str, Any]:
+        await self._ready.wait()
+        self._ready.clear()
+        message, self._pending = self._pending, None
+        return message
+
+
+class LiveStatsBroadcaster:
+    """Fan-out of live-stats changes to WebSocket subscribers. Runs entirely on the event loop thread."""
+
+    def __init__(self, max_subscribers: int = LIVE_STATS_MAX_SUBSCRIBERS):
+        self.max_subscribers = max_subscribers
+        self.subscribers: Set[Subscription] = set()
+        self.latest: Optional[Dict[str, Any]] = None
+        self.messages_published = 0
+        self.coalesced_total = 0
+        self.last_fanout_seconds = 0.0
+        self._last_sent = 0.0
+
+    def subscribe(self) -> Subscription:
+        if len(self.subscribers) >= self.max_subscribers:
+            raise SubscriberLimitReached()
+        subscription = Subscription()
+        if self.latest is not None:
+            subscription.offer({"type": "snapshot", "data": dict(self.latest), "sent_at": time.time()})
+        self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription in self.subscribers:
+            self.subscribers.discard(subscription)
+            self.coalesced_total += subscription.coalesced
+
+    def _fan_out(self, message: Dict[str, Any]) -> int:
+        started = time.perf_counter()
+        for subscription in self.subscribers:
+            subscription.offer(message)
+        self.last_fanout_seconds = time.perf_counter() - started
+        self.messages_published += 1
+        self._last_sent = time.monotonic()
+        return len(self.subscribers)
+
+    def publish(self, stats: Dict[str, Any]) -> int:
+        """Send whatever changed since the last publish; returns the number of subscribers reached"""
+        if self.latest is None:
+            self.latest = dict(stats)
+            return self._fan_out({"type": "snapshot", "data": dict(stats), "sent_at": time.time()})
+        changed = {key: value for key, value in stats.items() if self.latest.get(key) != value}
+        if not changed:
+            return 0
+        self.latest.update(changed)
+        return self._fan_out({"type": "delta", "data": changed, "sent_at": time.time()})
+
+    def heartbeat(self) -> int:
+        """Keeps idle connections (and proxies in front of them) alive"""
+        return self._fan_out({"type": "heartbeat", "data": {}, "sent_at": time.time()})
+
+    async def run(self, db, interval: float = LIVE_STATS_PUSH_SECONDS):
+        while True:
+            try:
+                if self.subscribers:
+                    stats = public_stats(await read_live_stats_async(db))
+                    if not self.publish(stats) and time.monotonic() - self._last_sent >= LIVE_STATS_HEARTBEAT_SECONDS:
+                        self.heartbeat()
+            except Exception as e:
+                print(f"Live stats broadcast error: {e}")
+            await asyncio.sleep(interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self.subscribers),
+            "max_subscribers": self.max_subscribers,
+            "messages_published": self.messages_published,
+            "coalesced_messages": self.coalesced_total + sum(s.coalesced for s in self.subscribers),
+            "last_fanout_ms": round(self.last_fanout_seconds * 1000, 3),
+            "push_interval_seconds": LIVE_STATS_PUSH_SECONDS,
+        }
+
+
+live_stats_broadcaster = LiveStatsBroadcaster()
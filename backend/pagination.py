@@ -0,0 +1,62 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import DESCENDING
+
+
+def keyset_sort(field: str = "created_at") -> List[Tuple[str, int]]:
+    """Newest-first keyset order on `field`; _id breaks ties between documents with the same timestamp"""
+    return [(field, DESCENDING), ("_id", DESCENDING)]
+
+
+KEYSET_SORT = keyset_sort()
+# A player's tournament history, by when they joined
+REGISTRATION_KEYSET_SORT = keyset_sort("registered_at")
+
+
+class InvalidCursor(ValueError):
+    """Raised for a cursor that wasn't produced by encode_cursor"""
+
+
+def encode_cursor(document: Dict[str, Any], field: str = "created_at") -> str:
+    """Opaque cursor pointing just past `document` in keyset_sort(field) order"""
+    payload = {"t": document[field].isoformat(), "id": str(document["_id"])}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidId) as e:
+        raise InvalidCursor(str(e)) from e
+
+
+def apply_cursor(query: Dict[str, Any], cursor: Optional[str], field: str = "created_at") -> Dict[str, Any]:
+    """Return `query` restricted to documents after `cursor` (unchanged when there is no cursor)"""
+    if not cursor:
+        return query
+    timestamp, object_id = decode_cursor(cursor)
+    after = {"$or": [
+        {field: {"$lt": timestamp}},
+        {field: timestamp, "_id": {"$lt": object_id}},
+    ]}
+    if not query:
+        return after
+    return {"$and": [query, after]}
+
+
+def next_cursor(documents: List[Dict[str, Any]], limit: int, field: str = "created_at") -> Optional[str]:
+    """Cursor for the following page, or None when this page was the last one"""
+    if len(documents) < limit or not documents:
+        return None
+    last = documents[-1]
+    if not isinstance(last.get(field), datetime):
+        # Legacy rows without a datetime sort after every dated row and a range on `field` can't
+        # reach them, so there is no cursor page after this one
+        return None
+    return encode_cursor({field: last[field], "_id": ObjectId(str(last["_id"]))}, field)
@@ -0,0 +1,83 @@
+import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any
+from passlib.context import CryptContext
+
+# bcrypt releases the GIL while hashing, so a thread pool gives real parallelism
+# without the pickling overhead of a process pool.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+# Maximum hash/verify jobs admitted at once (running + waiting); beyond this callers get rejected.
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+_lock = threading.Lock()
+_stats = {
+    "pending": 0,
+    "running": 0,
+    "completed": 0,
+    "rejected": 0,
+    "total_seconds": 0.0,
+}
+
+
+class PasswordPoolSaturated(Exception):
+    """Raised when the hashing pool already has PASSWORD_HASH_MAX_PENDING jobs admitted"""
+
+
+def _run_timed(func, *args):
+    with _lock:
+        _stats["running"] += 1
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        elapsed = time.perf_counter() - started
+        with _lock:
+            _stats["running"] -= 1
+            _stats["completed"] += 1
+            _stats["total_seconds"] += elapsed
+
+
+async def _submit(func, *args):
+    with _lock:
+        if _stats["pending"] >= PASSWORD_HASH_MAX_PENDING:
+            _stats["rejected"] += 1
+            raise PasswordPoolSaturated()
+        _stats["pending"] += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, _run_timed, func, *args)
+    finally:
+        with _lock:
+            _stats["pending"] -= 1
+
+
+async def hash_password(password: str) -> str:
+    return await _submit(pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _submit(pwd_context.verify, plain_password, hashed_password)
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    with _lock:
+        completed = _stats["completed"]
+        return {
+            "workers": PASSWORD_HASH_WORKERS,
+            "max_pending": PASSWORD_HASH_MAX_PENDING,
+            "running": _stats["running"],
+            "queue_depth": max(0, _stats["pending"] - _stats["running"]),
+            "completed": completed,
+            "rejected": _stats["rejected"],
+            "avg_ms": round(_stats["total_seconds"] / completed * 1000, 2) if completed else 0.0,
+        }
+
+
+def shutdown_pool():
+    _executor.shutdown(wait=False)
@@ -0,0 +1,53 @@
+from typing import Dict, Iterable, Optional, Tuple
+from pagination import KEYSET_SORT
+
+# Fields a tournament card needs (listing pages, home carousel, dashboard)
+TOURNAMENT_CARD_FIELDS: Tuple[str, ...] = (
+    "tournament_id", "name", "status", "game_type", "tournament_type", "mode", "country",
+    "entry_fee", "prize_pool", "max_participants", "current_participants",
+    "start_time", "registration_deadline", "battle_map", "created_at",
+)
+# What `fields=` may ask for on tournament listings; the participant list is never sent in bulk
+TOURNAMENT_FIELDS: Tuple[str, ...] = TOURNAMENT_CARD_FIELDS + (
+    "description", "rules", "prizes", "schedule", "featured_image", "created_by", "updated_at",
+)
+
+TRANSACTION_FIELDS: Tuple[str, ...] = (
+    "transaction_id", "type", "amount", "description", "category", "status", "payment_method", "created_at",
+)
+
+# Keyset-paginated listings always need these to build next_cursor
+KEYSET_FIELDS: Tuple[str, ...] = tuple(field for field, _ in KEYSET_SORT)
+
+
+class InvalidFields(ValueError):
+    """Raised for a `fields=` value naming fields the endpoint doesn't expose"""
+
+
+def projection(
+    fields: Optional[str],
+    default: Iterable[str],
+    allowed: Iterable[str],
+    required: Iterable[str] = (),
+) -> Dict[str, int]:
+    """
+    Mongo inclusion projection for an endpoint: its `default` field set, or the comma-separated
+    sparse fieldset from `fields=` checked against `allowed`. `required` fields are always added;
+    _id is excluded unless it's one of them.
+    """
+    if fields:
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(allowed))
+        if unknown:
+            raise InvalidFields(f"Unknown fields: {', '.join(unknown)}")
+    else:
+        requested = list(default)
+
+    spec = {name: 1 for name in (*requested, *required)}
+    if "_id" not in spec:
+        spec["_id"] = 0
+    return spec
+
+
+TOURNAMENT_CARD_PROJECTION = projection(None, TOURNAMENT_CARD_FIELDS, TOURNAMENT_FIELDS)
+TRANSACTION_PROJECTION = projection(None, TRANSACTION_FIELDS, TRANSACTION_FIELDS)
@@ -0,0 +1,86 @@
+import asyncio
+from typing import Any, Callable, Dict, List, Tuple
+from fastapi import HTTPException
+
+
+class RegistrationBatcher:
+    """
+    Per-tournament join queue that coalesces concurrent requests into one commit.
+
+    A request for a tournament with nothing queued or committing is committed straight away.
+    While a commit for that tournament is in flight, requests arriving within `window_ms`
+    (or until `max_batch_size` is reached) are handed together to
+    `commit_batch(tournament_id, requests)`, a blocking function run in the default executor. It must return one result per request, in order;
+    a result that is an Exception is raised to that request's caller, anything else is returned.
+    """
+
+    def __init__(self, commit_batch: Callable[[str, List[dict]], List[Any]], window_ms: float, max_batch_size: int):
+        self.commit_batch = commit_batch
+        self.window_seconds = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, List[Tuple[dict, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._in_flight: Dict[str, int] = {}
+        self.batches = 0
+        self.requests = 0
+
+    async def submit(self, tournament_id: str, request: dict) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(tournament_id, [])
+        batch.append((request, future))
+
+        if len(batch) >= self.max_batch_size or (len(batch) == 1 and not self._in_flight.get(tournament_id)):
+            # Full batch, or an idle tournament: nothing to wait for
+            self._flush(tournament_id)
+        elif len(batch) == 1:
+            self._timers[tournament_id] = loop.call_later(self.window_seconds, self._flush, tournament_id)
+
+        return await future
+
+    def _flush(self, tournament_id: str):
+        timer = self._timers.pop(tournament_id, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(tournament_id, None)
+        if batch:
+            self._in_flight[tournament_id] = self._in_flight.get(tournament_id, 0) + 1
+            asyncio.ensure_future(self._commit(tournament_id, batch))
+
+    async def _commit(self, tournament_id: str, batch: List[Tuple[dict, asyncio.Future]]):
+        self.batches += 1
+        self.requests += len(batch)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(None, self.commit_batch, tournament_id, [request for request, _ in batch])
+        except Exception as e:
+            print(f"Registration batch for {tournament_id} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    # One exception per waiter: a shared instance would collect every caller's traceback
+                    future.set_exception(HTTPException(status_code=500, detail="Registration failed"))
+            return
+        finally:
+            remaining = self._in_flight.pop(tournament_id, 1) - 1
+            if remaining:
+                self._in_flight[tournament_id] = remaining
+
+        for (_, future), result in zip(batch, results):
+            # A caller that disconnected has a cancelled future; its registration still stands
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "avg_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "queued": sum(len(batch) for batch in self._pending.values()),
+            "in_flight": sum(self._in_flight.values()),
+            "window_ms": self.window_seconds * 1000,
+            "max_batch_size": self.max_batch_size,
+        }
@@ -0,0 +1,108 @@
+import os
+import hashlib
+from typing import Any, Dict, Hashable, Tuple
+from starlette.requests import Request
+from starlette.responses import Response
+from ttl_cache import TTLCache
+
+# Public read routes whose JSON is identical for every caller, with their cache TTLs.
+# Only exact paths are cached (/api/leaderboards/me is per-user and isn't).
+CACHED_ROUTES: Dict[str, float] = {
+    "/api/tournaments": float(os.getenv("RESPONSE_CACHE_TOURNAMENTS_TTL_SECONDS", 5)),
+    "/api/leaderboards": float(os.getenv("RESPONSE_CACHE_LEADERBOARDS_TTL_SECONDS", 15)),
+    "/api/live-stats": float(os.getenv("RESPONSE_CACHE_LIVE_STATS_TTL_SECONDS", 5)),
+}
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1000))
+
+# Headers for a degraded answer (e.g. fallback data after a database error): sent to the client
+# but never stored here or by any other cache
+NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+
+class ResponseCache:
+    """
+    HTTP middleware caching whole responses of CACHED_ROUTES, keyed by path and normalized
+    query string, with a strong ETag on every response and 304s for matching If-None-Match.
+
+    invalidate(path) bumps the route's generation so every cached variant of it is bypassed at
+    once; the stale entries just age out. It's per process, so other workers catch up within the TTL.
+    """
+
+    def __init__(self, routes: Dict[str, float], maxsize: int):
+        self.routes = routes
+        self._entries = TTLCache(maxsize=maxsize, ttl_seconds=max(routes.values()))
+        self._generations = {path: 0 for path in routes}
+        self.not_modified = 0
+        self.route_invalidations = 0
+
+    def _key(self, request: Request) -> Hashable:
+        # Parameter order and empty values don't change the result
+        params = tuple(sorted((name, value) for name, value in request.query_params.multi_items() if value != ""))
+        return (request.url.path, self._generations[request.url.path], params)
+
+    def invalidate(self, *paths: str):
+        for path in paths:
+            if path in self._generations:
+                self._generations[path] += 1
+                self.route_invalidations += 1
+
+    def _respond(self, request: Request, entry: Tuple[int, bytes, Dict[str, str], str], cache_status: str) -> Response:
+        status_code, body, headers, etag = entry
+        headers = {**headers, "ETag": etag, "Cache-Control": "no-cache", "X-Cache": cache_status}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            self.not_modified += 1
+            headers.pop("content-length", None)
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, status_code=status_code, headers=headers)
+
+    async def middleware(self, request: Request, call_next) -> Response:
+        if request.method != "GET" or request.url.path not in self.routes:
+            return await call_next(request)
+
+        key = self._key(request)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return self._respond(request, entry, "HIT")
+
+        response = await call_next(request)
+        if response.status_code != 200 or "no-store" in response.headers.get("cache-control", ""):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ("etag", "cache-control")
+        }
+        entry = (response.status_code, body, headers, strong_etag(body))
+        # A route invalidated while this response was being computed may already be stale
+        if key[1] == self._generations[request.url.path]:
+            self._entries.set(key, entry, ttl_seconds=self.routes[request.url.path])
+        return self._respond(request, entry, "MISS")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._entries.stats(),
+            "enabled": RESPONSE_CACHE_ENABLED,
+            "route_ttls": self.routes,
+            "not_modified": self.not_modified,
+            "route_invalidations": self.route_invalidations,
+        }
+
+
+response_cache = ResponseCache(CACHED_ROUTES, RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def install_response_cache(app):
+    """Register the cache middleware on a FastAPI app (no-op when RESPONSE_CACHE_ENABLED is false)"""
+    if RESPONSE_CACHE_ENABLED:
+        app.middleware("http")(response_cache.middleware)
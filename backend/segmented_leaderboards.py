@@ -0,0 +1,264 @@
+import os
+import sys
+import uuid
+import argparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from leaderboard_profiles import profile_fields
+from indexes import INDEXES
+
+# Every board is rows of {board_id, user_id, points, ...} in one collection, read with a single
+# indexed find on (board_id, points desc, user_id). Rows are updated incrementally per match result.
+SEGMENT_SORT = [("points", DESCENDING), ("user_id", ASCENDING)]
+SEGMENT_PROJECTION = {"_id": 0, "board_id": 0}
+
+BOARD_CATEGORIES = ("overall", "region", "game_type", "season", "tournament")
+
+# Battle royale scoring: placement points plus one point per kill
+PLACEMENT_POINTS = {1: 15, 2: 12, 3: 10, 4: 8, 5: 6, 6: 4, 7: 2, 8: 1}
+KILL_POINTS = 1
+
+REBUILD_CATCH_UP_PASSES = 5
+
+
+# Query parameter carrying each segmented category's value on GET /api/leaderboards
+SEGMENT_PARAMS = {"region": "region", "game_type": "game_type", "season": "season", "tournament": "tournament_id"}
+
+
+def resolve_board(category: Optional[str], segments: Dict[str, Optional[str]]) -> str:
+    """
+    Board for a leaderboard request, the same rule in both servers. `segments` maps segmented
+    categories to the values given. Without a category, a single value selects its board (only
+    tournament_id -> that tournament's board) and none selects overall. A value that doesn't
+    belong to the chosen category is rejected rather than ignored. Raises ValueError.
+    """
+    given = {name: value for name, value in segments.items() if value}
+    if category is None:
+        if len(given) > 1:
+            names = ", ".join(SEGMENT_PARAMS[name] for name in sorted(given))
+            raise ValueError(f"Ambiguous leaderboard: pass category= to choose between {names}")
+        category = next(iter(given), "overall")
+    stray = [SEGMENT_PARAMS[name] for name in sorted(given) if name != category]
+    if stray:
+        raise ValueError(f"{', '.join(stray)} doesn't apply to the '{category}' leaderboard")
+    return board_id(category, given.get(category))
+
+
+def match_points(placement: int, kills: int) -> int:
+    return PLACEMENT_POINTS.get(placement, 0) + kills * KILL_POINTS
+
+
+def season_of(moment: datetime) -> str:
+    """Quarterly seasons, e.g. 2026-S4"""
+    return f"{moment.year}-S{(moment.month - 1) // 3 + 1}"
+
+
+def board_id(category: str, value: Optional[str] = None) -> str:
+    """
+    Storage key for a board. Raises ValueError for an unknown category or a
+    segmented category without a value.
+    """
+    if category not in BOARD_CATEGORIES:
+        raise ValueError(f"Unknown leaderboard category '{category}'")
+    if category == "overall":
+        return "overall"
+    if not value:
+        raise ValueError(f"Leaderboard category '{category}' needs a value")
+    if category == "region":
+        value = value.upper()
+    return f"{category}:{value}"
+
+
+def boards_for_match(match: Dict[str, Any], tournament: Dict[str, Any], user: Dict[str, Any]) -> List[str]:
+    boards = [
+        board_id("overall"),
+        board_id("game_type", tournament.get("game_type") or "free_fire"),
+        board_id("season", season_of(match.get("match_date") or datetime.utcnow())),
+        board_id("tournament", match["tournament_id"]),
+    ]
+    if user.get("region"):
+        boards.append(board_id("region", user["region"]))
+    return boards
+
+
+def _segment_updates(match: Dict[str, Any], tournament: Dict[str, Any], user: Dict[str, Any]) -> List[UpdateOne]:
+    now = datetime.utcnow()
+    increments = {
+        "points": match_points(match.get("placement", 0), match.get("kills", 0)),
+        "matches_played": 1,
+        "wins": 1 if match.get("placement") == 1 else 0,
+        "total_kills": match.get("kills", 0),
+        "total_earnings": match.get("earnings", 0),
+    }
+    profile = {
+        "username": user.get("username") or user.get("free_fire_data", {}).get("username", ""),
+        "full_name": user.get("full_name", ""),
+        **profile_fields(user),
+        "updated_at": now,
+    }
+    return [
+        UpdateOne(
+            {"board_id": board, "user_id": match["user_id"]},
+            {"$inc": increments, "$set": profile, "$setOnInsert": {"created_at": now}},
+            upsert=True
+        )
+        for board in boards_for_match(match, tournament, user)
+    ]
+
+
+def record_match_results(db, tournament: Dict[str, Any], results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Store match results for one tournament and fold them into every board they touch:
+    one users $in fetch, one insert_many and one bulk upsert regardless of result count.
+    Each result needs user_id, placement and kills; returns the stored match documents.
+    """
+    if not results:
+        return []
+    now = datetime.utcnow()
+    users = {
+        user["user_id"]: user
+        for user in db.users.find(
+            {"user_id": {"$in": [result["user_id"] for result in results]}},
+            {"_id": 0, "user_id": 1, "username": 1, "full_name": 1, "region": 1, "free_fire_data": 1}
+        )
+    }
+    matches = []
+    for result in results:
+        matches.append({
+            "match_id": str(uuid.uuid4()),
+            "tournament_id": tournament["tournament_id"],
+            "user_id": result["user_id"],
+            "placement": result["placement"],
+            "kills": result.get("kills", 0),
+            "damage_dealt": result.get("damage_dealt", 0),
+            "survival_time": result.get("survival_time", 0),
+            "earnings": result.get("earnings", 0),
+            "match_date": result.get("match_date") or now,
+            "created_at": now
+        })
+    db.matches.insert_many([dict(match) for match in matches])
+
+    operations = []
+    for match in matches:
+        operations.extend(_segment_updates(match, tournament, users.get(match["user_id"], {"user_id": match["user_id"]})))
+    db.leaderboard_segments.bulk_write(operations, ordered=False)
+    return matches
+
+
+def get_board(db, board: str, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+    """Top of one board with 1-based ranks: a single indexed read"""
+    rows = list(
+        db.leaderboard_segments.find({"board_id": board}, SEGMENT_PROJECTION)
+        .sort(SEGMENT_SORT).skip(offset).limit(limit)
+    )
+    for position, row in enumerate(rows):
+        row["rank"] = offset + position + 1
+    return rows
+
+
+def rebuild_segments(db, batch_size: int = 1000) -> int:
+    """
+    Recompute every board from the matches collection, e.g. after seeding or to repair drift.
+    Boards are rebuilt into a fresh collection and swapped in, so readers never see a partial state.
+
+    Results recorded while it runs only $inc the live collection, which the swap replaces, so
+    matches created after the rebuild started are replayed into the new boards before the swap.
+    A result whose board update lands in the moment between the last replay and the swap can
+    still be lost or counted twice: run it from the CLI or a seed script while results aren't
+    being submitted, never from a request handler.
+    """
+    staging = db[f"leaderboard_segments_rebuild_{uuid.uuid4().hex[:8]}"]
+    # Indexed up front: the upserts need the unique key, and rename keeps the source's indexes
+    staging.create_indexes(INDEXES["leaderboard_segments"])
+    tournaments = {
+        t["tournament_id"]: t
+        for t in db.tournaments.find({}, {"_id": 0, "tournament_id": 1, "game_type": 1})
+    }
+
+    def fold(matches: List[Dict[str, Any]]) -> int:
+        """Fold match documents into the staging boards in batches; returns how many were read"""
+        count = 0
+        batch = []
+        for match in matches:
+            batch.append(match)
+            count += 1
+            if len(batch) == batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+        return count
+
+    def flush(batch: List[Dict[str, Any]]):
+        for match in batch:
+            if match["tournament_id"] not in tournaments:
+                tournament = db.tournaments.find_one({"tournament_id": match["tournament_id"]}, {"_id": 0, "tournament_id": 1, "game_type": 1})
+                tournaments[match["tournament_id"]] = tournament or {"tournament_id": match["tournament_id"]}
+        users = {
+            user["user_id"]: user
+            for user in db.users.find(
+                {"user_id": {"$in": list({match["user_id"] for match in batch})}},
+                {"_id": 0, "user_id": 1, "username": 1, "full_name": 1, "region": 1, "free_fire_data": 1}
+            )
+        }
+        operations = []
+        for match in batch:
+            tournament = tournaments[match["tournament_id"]]
+            operations.extend(_segment_updates(match, tournament, users.get(match["user_id"], {"user_id": match["user_id"]})))
+        staging.bulk_write(operations, ordered=False)
+
+    # Every match falls on exactly one side of `started`: the full scan takes the older ones (and
+    # seeded documents without created_at), the catch-up passes take everything recorded since
+    started = datetime.utcnow()
+    processed = fold(
+        db.matches.find(
+            {"$or": [{"created_at": {"$lt": started}}, {"created_at": None}]},
+            {"_id": 0}
+        ).batch_size(batch_size)
+    )
+    # Each pass is shorter than the one before; bounded so steady traffic can't keep it from finishing
+    for _ in range(REBUILD_CATCH_UP_PASSES):
+        cutoff = datetime.utcnow()
+        caught_up = fold(
+            db.matches.find({"created_at": {"$gte": started, "$lt": cutoff}}, {"_id": 0}).batch_size(batch_size)
+        )
+        processed += caught_up
+        started = cutoff
+        if not caught_up:
+            break
+
+    if processed:
+        staging.rename("leaderboard_segments", dropTarget=True)
+    else:
+        staging.drop()
+        db.leaderboard_segments.delete_many({})
+    print(f"✅ Rebuilt segmented leaderboards from {processed} match results")
+    return processed
+
+
+def main():
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Segmented leaderboard maintenance")
+    parser.add_argument("command", choices=["rebuild", "show"])
+    parser.add_argument("--category", default="overall", choices=BOARD_CATEGORIES)
+    parser.add_argument("--value")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    mongo_url = os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db")
+    db = MongoClient(mongo_url)[os.getenv("MONGO_DB_NAME", "tournament_db")]
+
+    if args.command == "rebuild":
+        rebuild_segments(db)
+    else:
+        for row in get_board(db, board_id(args.category, args.value), args.limit):
+            print(f"#{row['rank']:<4} {row['username']:<20} {row['points']:>6} pts  {row['matches_played']} matches")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+from decimal import Decimal
+from typing import Any
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+
+# Projection for reads whose response has no use for the Mongo _id
+NO_ID = {"_id": 0}
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson-backed JSON response. datetimes come out as ISO 8601 (same text as .isoformat())
+    and ObjectIds as strings, so Mongo documents can be returned as-is.
+
+    Returning an instance directly from a handler also skips FastAPI's jsonable_encoder pass;
+    as the app's default_response_class it only replaces the final json.dumps.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,14 +1,13 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, status, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pymongo import MongoClient
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, EmailStr
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 import os
 from dotenv import load_dotenv
 import jwt
-from passlib.context import CryptContext
 import uuid
 import httpx
 import json
@@ -20,11 +19,76 @@ import asyncio
 import numpy as np
 import random
 from qr_service import generate_qr_code
+from database import (
+    db,
+    ping as ping_database,
+    close_client as close_database_client,
+    users_collection,
+    tournaments_collection,
+    registrations_collection,
+    leaderboards_collection,
+    leaderboard_segments_collection,
+    transactions_collection,
+    payments_collection,
+    ai_predictions_collection,
+)
+from password_service import (
+    hash_password as pool_hash_password,
+    verify_password as pool_verify_password,
+    get_pool_stats as get_password_pool_stats,
+    shutdown_pool as shutdown_password_pool,
+    PasswordPoolSaturated,
+)
+from indexes import ensure_indexes_async
+from pagination import KEYSET_SORT, InvalidCursor, apply_cursor, next_cursor
+from freefire_client import (
+    validate_free_fire_uid,
+    FreeFireUnavailable,
+    close_http_client as close_freefire_client,
+    get_freefire_client_stats,
+)
+from leaderboard_service import (
+    leaderboard_index,
+    run_rebuild_loop as run_leaderboard_rebuild_loop,
+    get_leaderboard_index_stats,
+)
+from segmented_leaderboards import resolve_board, SEGMENT_SORT, SEGMENT_PROJECTION
+from live_stats import (
+    bump_live_stats_async,
+    tournament_deltas,
+    read_live_stats_async,
+    run_reconcile_loop as run_live_stats_reconcile_loop,
+    get_live_stats_cache_stats,
+)
+from live_stats_broadcast import live_stats_broadcaster, public_stats, SubscriberLimitReached
+from response_cache import response_cache, install_response_cache
+from single_flight import single_flight, get_single_flight_stats
+from serialization import FastJSONResponse, NO_ID
+from projections import (
+    projection,
+    InvalidFields,
+    TOURNAMENT_CARD_FIELDS,
+    TOURNAMENT_FIELDS,
+    TOURNAMENT_CARD_PROJECTION,
+    TRANSACTION_FIELDS,
+    TRANSACTION_PROJECTION,
+    KEYSET_FIELDS,
+)
+from user_cache import get_cached_user, cache_user, invalidate_user, get_user_cache_stats
+from token_versions import (
+    current_version as current_token_version,
+    is_current as is_token_version_current,
+    run_refresh_loop as run_token_version_refresh_loop,
+    get_token_version_stats,
+)
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Free Fire Tournament API", version="2.0.0")
+app = FastAPI(title="Free Fire Tournament API", version="2.0.0", default_response_class=FastJSONResponse)
+
+# Response cache sits inside CORS so cached bodies get per-request CORS headers
+install_response_cache(app)
 
 # Add CORS middleware
 app.add_middleware(
@@ -35,42 +99,47 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
-# Database configuration
-MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db")
+# JWT configuration
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your_super_secret_jwt_key_change_this_in_production")
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Opt-in: embed is_admin/nickname/region/version in tokens so read-only routes skip the user fetch
+JWT_CLAIMS_MODE = os.getenv("JWT_CLAIMS_MODE", "false").lower() == "true"
+CLAIMS_TOKEN_FORMAT = "claims"
 
-# Initialize database
-try:
-    client = MongoClient(MONGO_URL)
-    db = client.tournament_db
-    
-    # Collections
-    users_collection = db.users
-    tournaments_collection = db.tournaments
-    leaderboards_collection = db.leaderboards
-    transactions_collection = db.transactions
-    payments_collection = db.payments
-    ai_predictions_collection = db.ai_predictions
-    
-    # Create indexes for better performance and constraints
-    users_collection.create_index("email", unique=True)
-    users_collection.create_index("free_fire_uid", unique=True)
-    leaderboards_collection.create_index("user_id")
-    transactions_collection.create_index("user_id")
+# Batch Free Fire validation limits
+FREE_FIRE_BATCH_CONCURRENCY = int(os.getenv("FREE_FIRE_BATCH_CONCURRENCY", 10))
+FREE_FIRE_BATCH_MAX_SIZE = int(os.getenv("FREE_FIRE_BATCH_MAX_SIZE", 200))
+
+# Background loops started at startup; held here so they aren't garbage-collected while pending
+background_tasks: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def startup_database():
+    if await ping_database():
+        print("✅ Database connected successfully!")
     
-    print("✅ Database connected successfully!")
-except Exception as e:
-    print(f"❌ Database connection failed: {e}")
-    raise
+    # Index builds are idempotent and run in the background, outside the request path
+    background_tasks.extend([
+        asyncio.create_task(ensure_indexes_async(db)),
+        asyncio.create_task(run_token_version_refresh_loop()),
+        asyncio.create_task(run_leaderboard_rebuild_loop()),
+        asyncio.create_task(run_live_stats_reconcile_loop(db)),
+        asyncio.create_task(live_stats_broadcaster.run(db)),
+    ])
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-security = HTTPBearer()
+@app.on_event("shutdown")
+async def shutdown_database():
+    # Stop the loops before the Motor client they use is closed
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+    close_database_client()
+    shutdown_password_pool()
+    await close_freefire_client()
 
-# Free Fire API configuration
-FREE_FIRE_API_BASE = "https://region-info-api.vercel.app"
+security = HTTPBearer()
 
 # Pydantic models
 class UserRegistration(BaseModel):
@@ -88,12 +157,31 @@ class Token(BaseModel):
     token_type: str
     user: dict
 
+class FreeFireLookup(BaseModel):
+    uid: str
+    region: str
+
+class FreeFireBatchValidation(BaseModel):
+    players: List[FreeFireLookup]
+
 # Utility functions
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+password_pool_busy_exception = HTTPException(
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    detail="Authentication service is busy, please retry shortly",
+    headers={"Retry-After": "1"},
+)
+
+async def verify_password(plain_password, hashed_password):
+    try:
+        return await pool_verify_password(plain_password, hashed_password)
+    except PasswordPoolSaturated:
+        raise password_pool_busy_exception
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+async def get_password_hash(password):
+    try:
+        return await pool_hash_password(password)
+    except PasswordPoolSaturated:
+        raise password_pool_busy_exception
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -105,6 +193,21 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
+def build_token_claims(user: dict) -> dict:
+    """Token payload for a user: `sub` only, or the full claims format when JWT_CLAIMS_MODE is on"""
+    if not JWT_CLAIMS_MODE:
+        return {"sub": user["user_id"]}
+    return {
+        "sub": user["user_id"],
+        "fmt": CLAIMS_TOKEN_FORMAT,
+        "ver": current_token_version(user["user_id"]),
+        "is_admin": user.get("is_admin", False),
+        "nickname": user.get("nickname"),
+        "region": user.get("region"),
+        "level": user.get("level", 1),
+        "clan_name": user.get("clan_name", "No Guild"),
+    }
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -119,75 +222,95 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.PyJWTError:
         raise credentials_exception
     
-    user = users_collection.find_one({"user_id": user_id})
+    user = get_cached_user(user_id)
+    if user is not None:
+        return user
+    
+    user = await users_collection.find_one({"user_id": user_id})
     if user is None:
         raise credentials_exception
+    cache_user(user)
     return user
 
-async def validate_free_fire_uid(uid: str, region: str) -> dict:
-    """Validate Free Fire UID using the region info API"""
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.get(
-                f"{FREE_FIRE_API_BASE}/player-info",
-                params={"uid": uid, "region": region.lower()}
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "player_info" in data:
-                    player_info = data["player_info"]
-                    basic_info = player_info.get("basicInfo", {})
-                    guild_info = player_info.get("guildInfo", {})
-                    profile_info = player_info.get("profileInfo", {})
-                    
-                    return {
-                        "uid": uid,
-                        "region": region.upper(),
-                        "nickname": basic_info.get("nickname", "Unknown"),
-                        "level": basic_info.get("level", 1),
-                        "avatar_id": profile_info.get("avatarId", "102000007"),
-                        "liked": basic_info.get("liked", 0),
-                        "exp": basic_info.get("exp", 0),
-                        "clan_name": guild_info.get("guildName", "No Guild"),
-                        "clan_level": guild_info.get("guildLevel", 1),
-                        "validated_at": datetime.utcnow().isoformat()
-                    }
-            return None
-        except Exception as e:
-            print(f"Free Fire API error: {e}")
-            return None
+async def get_current_principal(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    """
+    Authorize from token claims alone for read-only routes.
+    Falls back to get_current_user for sub-only tokens or tokens issued before a revocation.
+    """
+    try:
+        payload = jwt.decode(credentials.credentials, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+    except jwt.PyJWTError:
+        payload = {}
+    
+    user_id = payload.get("sub")
+    if (
+        user_id
+        and payload.get("fmt") == CLAIMS_TOKEN_FORMAT
+        and is_token_version_current(user_id, payload.get("ver", 0))
+    ):
+        return {
+            "user_id": user_id,
+            "is_admin": payload.get("is_admin", False),
+            "nickname": payload.get("nickname"),
+            "region": payload.get("region"),
+            "level": payload.get("level", 1),
+            "clan_name": payload.get("clan_name", "No Guild"),
+        }
+    return await get_current_user(credentials)
 
 # API Endpoints
 
 @app.get("/api/health")
 async def health_check():
+    database_ok = await ping_database()
     return {
-        "status": "healthy",
+        "status": "healthy" if database_ok else "degraded",
         "timestamp": datetime.utcnow().isoformat(),
-        "database": "connected",
+        "database": "connected" if database_ok else "unreachable",
         "version": "2.0.0"
     }
 
+@app.get("/api/metrics")
+async def get_metrics():
+    return {
+        "password_hashing": get_password_pool_stats(),
+        "user_cache": get_user_cache_stats(),
+        "token_versions": get_token_version_stats(),
+        "freefire_client": get_freefire_client_stats(),
+        "leaderboard_index": get_leaderboard_index_stats(),
+        "live_stats": get_live_stats_cache_stats(),
+        "live_stats_push": live_stats_broadcaster.stats(),
+        "response_cache": response_cache.stats(),
+        "single_flight": get_single_flight_stats(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
 @app.post("/api/auth/register", response_model=Token)
 async def register_user(user_data: UserRegistration):
     try:
         # Check if email already exists
-        if users_collection.find_one({"email": user_data.email}):
+        if await users_collection.find_one({"email": user_data.email}):
             raise HTTPException(status_code=400, detail="Email already registered")
         
         # Check if Free Fire UID already exists
-        if users_collection.find_one({"free_fire_uid": user_data.free_fire_uid}):
+        if await users_collection.find_one({"free_fire_uid": user_data.free_fire_uid}):
             raise HTTPException(status_code=400, detail="Free Fire UID already registered")
         
         # Validate Free Fire UID
-        ff_player_info = await validate_free_fire_uid(user_data.free_fire_uid, user_data.region)
+        try:
+            ff_player_info = await validate_free_fire_uid(user_data.free_fire_uid, user_data.region)
+        except FreeFireUnavailable:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Free Fire verification is temporarily unavailable, please retry shortly",
+                headers={"Retry-After": "30"},
+            )
         if not ff_player_info:
             raise HTTPException(status_code=400, detail="Invalid Free Fire UID or region")
         
         # Create user
         user_id = str(uuid.uuid4())
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash(user_data.password)
         
         user_doc = {
             "user_id": user_id,
@@ -219,7 +342,9 @@ async def register_user(user_data: UserRegistration):
         }
         
         # Insert user
-        users_collection.insert_one(user_doc)
+        await users_collection.insert_one(user_doc)
+        await bump_live_stats_async(db.live_stats, total_users=1)
+        response_cache.invalidate("/api/leaderboards", "/api/live-stats")
         
         # Create initial leaderboard entry
         leaderboard_doc = {
@@ -234,7 +359,8 @@ async def register_user(user_data: UserRegistration):
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
-        leaderboards_collection.insert_one(leaderboard_doc)
+        await leaderboards_collection.insert_one(leaderboard_doc)
+        leaderboard_index.upsert(leaderboard_doc)
         
         # Create welcome transaction
         transaction_doc = {
@@ -247,12 +373,12 @@ async def register_user(user_data: UserRegistration):
             "status": "completed",
             "created_at": datetime.utcnow()
         }
-        transactions_collection.insert_one(transaction_doc)
+        await transactions_collection.insert_one(transaction_doc)
         
         # Create access token
         access_token_expires = timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user_id}, expires_delta=access_token_expires
+            data=build_token_claims(user_doc), expires_delta=access_token_expires
         )
         
         return {
@@ -284,26 +410,27 @@ async def login_user(login_data: UserLogin):
         # Check if identifier is email or Free Fire UID
         user = None
         if "@" in login_data.identifier:
-            user = users_collection.find_one({"email": login_data.identifier})
+            user = await users_collection.find_one({"email": login_data.identifier})
         else:
-            user = users_collection.find_one({"free_fire_uid": login_data.identifier})
+            user = await users_collection.find_one({"free_fire_uid": login_data.identifier})
         
-        if not user or not verify_password(login_data.password, user["password_hash"]):
+        if not user or not await verify_password(login_data.password, user["password_hash"]):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
             )
         
         # Update last login
-        users_collection.update_one(
+        await users_collection.update_one(
             {"user_id": user["user_id"]},
             {"$set": {"last_login": datetime.utcnow()}}
         )
+        invalidate_user(user["user_id"])
         
         # Create access token
         access_token_expires = timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": user["user_id"]}, expires_delta=access_token_expires
+            data=build_token_claims(user), expires_delta=access_token_expires
         )
         
         return {
@@ -349,6 +476,9 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
 @app.get("/api/validate-freefire")
 async def validate_freefire_uid(uid: str, region: str):
     """Validate Free Fire UID and return player information"""
+    return await build_freefire_validation(uid, region)
+
+async def build_freefire_validation(uid: str, region: str) -> dict:
     try:
         if not uid.isdigit() or not (8 <= len(uid) <= 12):
             return {"valid": False, "error": "Free Fire UID must be 8-12 digits"}
@@ -362,17 +492,65 @@ async def validate_freefire_uid(uid: str, region: str):
             }
         else:
             return {"valid": False, "error": "Invalid Free Fire UID or region"}
+    except FreeFireUnavailable:
+        return {"valid": False, "retryable": True, "error": "Free Fire verification is temporarily unavailable"}
     except Exception as e:
         return {"valid": False, "error": f"Validation error: {str(e)}"}
 
+@app.post("/api/validate-freefire/batch")
+async def validate_freefire_batch(batch: FreeFireBatchValidation):
+    """
+    Validate many Free Fire UIDs concurrently.
+    Streams one NDJSON line per player as soon as its lookup finishes (not in request order).
+    """
+    if not batch.players:
+        raise HTTPException(status_code=400, detail="At least one player is required")
+    if len(batch.players) > FREE_FIRE_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch size cannot exceed {FREE_FIRE_BATCH_MAX_SIZE} players"
+        )
+    
+    semaphore = asyncio.Semaphore(FREE_FIRE_BATCH_CONCURRENCY)
+    
+    async def validate_one(index: int, player: FreeFireLookup) -> dict:
+        async with semaphore:
+            result = await build_freefire_validation(player.uid, player.region)
+        return {"index": index, "uid": player.uid, "region": player.region, **result}
+    
+    async def stream_results():
+        tasks = [
+            asyncio.create_task(validate_one(index, player))
+            for index, player in enumerate(batch.players)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                yield json.dumps(result) + "\n"
+        finally:
+            # Client went away mid-stream: stop the lookups nobody will read
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
 @app.get("/api/tournaments")
+@single_flight(response_class=FastJSONResponse)
 async def get_tournaments(
     status: Optional[str] = None,
     game_type: Optional[str] = None,
     country: Optional[str] = None,
-    limit: int = 20
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ):
     try:
+        # Card-level fields by default; `fields=` narrows or widens within TOURNAMENT_FIELDS
+        try:
+            fields_projection = projection(fields, TOURNAMENT_CARD_FIELDS, TOURNAMENT_FIELDS, required=KEYSET_FIELDS)
+        except InvalidFields as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
         query = {}
         if status:
             query["status"] = status
@@ -380,14 +558,19 @@ async def get_tournaments(
             query["game_type"] = game_type
         if country:
             query["country"] = country
-            
-        tournaments = list(tournaments_collection.find(query).limit(limit).sort("created_at", -1))
         
-        # Convert ObjectId to string
-        for tournament in tournaments:
-            tournament["_id"] = str(tournament["_id"])
+        # Keyset pagination: pass back `next_cursor` to get the following page
+        try:
+            query = apply_cursor(query, cursor)
+        except InvalidCursor:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
             
-        return {"tournaments": tournaments, "count": len(tournaments)}
+        tournaments = await tournaments_collection.find(query, fields_projection).sort(KEYSET_SORT).limit(limit).to_list(length=limit)
+        
+        # _id is kept for the cursor; the response class serializes ObjectId and datetime as-is
+        return {"tournaments": tournaments, "count": len(tournaments), "next_cursor": next_cursor(tournaments, limit)}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Get tournaments error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch tournaments")
@@ -414,16 +597,16 @@ async def create_tournament(tournament_data: dict, current_user: dict = Depends(
             "mode": tournament_data["mode"],
             "country": tournament_data["country"],
             "status": "upcoming",
-            "participants": [],
             "created_by": current_user["user_id"],
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
         
-        tournaments_collection.insert_one(tournament_doc)
-        tournament_doc["_id"] = str(tournament_doc["_id"])
+        await tournaments_collection.insert_one(tournament_doc)
+        await bump_live_stats_async(db.live_stats, **tournament_deltas(None, tournament_doc))
+        response_cache.invalidate("/api/tournaments", "/api/live-stats")
         
-        return {"success": True, "tournament": tournament_doc}
+        return FastJSONResponse({"success": True, "tournament": tournament_doc})
     except HTTPException:
         raise
     except Exception as e:
@@ -431,76 +614,197 @@ async def create_tournament(tournament_data: dict, current_user: dict = Depends(
         raise HTTPException(status_code=500, detail="Failed to create tournament")
 
 @app.get("/api/leaderboards")
-async def get_leaderboards(category: str = "overall", limit: int = 50):
+@single_flight(response_class=FastJSONResponse)
+async def get_leaderboards(
+    category: Optional[str] = None,
+    region: Optional[str] = None,
+    game_type: Optional[str] = None,
+    season: Optional[str] = None,
+    tournament_id: Optional[str] = None,
+    limit: int = 50
+):
     try:
+        try:
+            board = resolve_board(category, {"region": region, "game_type": game_type, "season": season, "tournament": tournament_id})
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        if board != "overall":
+            
+            # Segmented boards are maintained as match results are recorded; serving is one indexed read
+            leaderboard_data = await (
+                leaderboard_segments_collection.find({"board_id": board}, SEGMENT_PROJECTION)
+                .sort(SEGMENT_SORT)
+                .limit(limit)
+                .to_list(length=limit)
+            )
+            for i, player in enumerate(leaderboard_data):
+                player["rank"] = i + 1
+            return {"leaderboard": leaderboard_data, "total_count": len(leaderboard_data), "board": board}
+        
+        # Served from the in-memory rank index once it has been built
+        if leaderboard_index.ready:
+            leaderboard_data = leaderboard_index.top(limit)
+            return {"leaderboard": leaderboard_data, "total_count": len(leaderboard_data)}
+        
         # Calculate real-time rankings
-        leaderboard_data = list(
-            leaderboards_collection.find()
+        leaderboard_data = await (
+            leaderboards_collection.find({}, NO_ID)
             .sort("points", -1)
             .limit(limit)
+            .to_list(length=limit)
         )
         
         # Update ranks
         for i, player in enumerate(leaderboard_data):
             player["rank"] = i + 1
-            player["_id"] = str(player["_id"])
             
         return {"leaderboard": leaderboard_data, "total_count": len(leaderboard_data)}
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Get leaderboards error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch leaderboards")
 
+@app.get("/api/leaderboards/me")
+async def get_leaderboard_around_me(window: int = 5, current_user: dict = Depends(get_current_principal)):
+    """The current player's exact rank plus `window` players above and below"""
+    try:
+        window = max(0, min(window, 50))
+        user_id = current_user["user_id"]
+        
+        if leaderboard_index.ready:
+            rank, rows = leaderboard_index.around(user_id, window)
+            total_players = len(leaderboard_index)
+        else:
+            rank, rows, total_players = await leaderboard_window_from_db(user_id, window)
+        
+        if rank is None:
+            raise HTTPException(status_code=404, detail="Player is not on the leaderboard")
+        
+        return {
+            "user_id": user_id,
+            "rank": rank,
+            "total_players": total_players,
+            "window": window,
+            "leaderboard": rows
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Get leaderboard window error: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch leaderboard position")
+
+async def leaderboard_window_from_db(user_id: str, window: int):
+    """Fallback before the rank index is built: range queries on the (points, user_id) index"""
+    me = await leaderboards_collection.find_one({"user_id": user_id}, {"_id": 0})
+    if me is None:
+        return None, [], 0
+    points = me.get("points", 0)
+    ahead_of_me = {"$or": [
+        {"points": {"$gt": points}},
+        {"points": points, "user_id": {"$lt": user_id}}
+    ]}
+    behind_me = {"$or": [
+        {"points": {"$lt": points}},
+        {"points": points, "user_id": {"$gt": user_id}}
+    ]}
+    ahead_count, above, below, total_players = await asyncio.gather(
+        leaderboards_collection.count_documents(ahead_of_me),
+        leaderboards_collection.find(ahead_of_me, {"_id": 0})
+            .sort([("points", 1), ("user_id", -1)]).limit(window).to_list(length=window),
+        leaderboards_collection.find(behind_me, {"_id": 0})
+            .sort([("points", -1), ("user_id", 1)]).limit(window).to_list(length=window),
+        leaderboards_collection.estimated_document_count()
+    )
+    rank = ahead_count + 1
+    rows = list(reversed(above)) + [me] + below
+    first_rank = rank - len(above)
+    for offset, row in enumerate(rows):
+        row["rank"] = first_rank + offset
+    return rank, rows, total_players
+
 @app.get("/api/live-stats")
 async def get_live_stats():
     try:
-        # Get real statistics from database
-        total_users = users_collection.count_documents({})
-        total_tournaments = tournaments_collection.count_documents({})
-        live_tournaments = tournaments_collection.count_documents({"status": "live"})
-        total_prize_pool = tournaments_collection.aggregate([
-            {"$group": {"_id": None, "total": {"$sum": "$prize_pool"}}}
-        ])
-        
-        prize_pool_result = list(total_prize_pool)
-        total_prize_amount = prize_pool_result[0]["total"] if prize_pool_result else 0
+        # Incrementally maintained counters, cached for a few seconds
+        stats = await read_live_stats_async(db)
         
         return {
-            "total_tournaments": total_tournaments,
-            "active_players": total_users,
-            "live_matches": live_tournaments,
-            "total_prize_pool": total_prize_amount,
-            "timestamp": datetime.utcnow().isoformat()
+            **public_stats(stats),
+            "timestamp": stats["updated_at"].isoformat() if stats.get("updated_at") else datetime.utcnow().isoformat()
         }
     except Exception as e:
         print(f"Get live stats error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch live stats")
 
+@app.websocket("/api/ws/live-stats")
+async def live_stats_socket(websocket: WebSocket):
+    """Pushes a snapshot on connect, then only the fields that change (plus periodic heartbeats)"""
+    try:
+        subscription = live_stats_broadcaster.subscribe()
+    except SubscriberLimitReached:
+        # 1013 = try again later; the client keeps its HTTP snapshot meanwhile
+        await websocket.accept()
+        await websocket.close(code=1013)
+        return
+    
+    async def push():
+        while True:
+            await websocket.send_json(await subscription.next())
+    
+    async def receive_until_disconnect():
+        # Clients send nothing we need, but reading is how a close is noticed before the next push
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+    
+    tasks = []
+    try:
+        await websocket.accept()
+        tasks = [asyncio.create_task(push()), asyncio.create_task(receive_until_disconnect())]
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error is not None and not isinstance(error, WebSocketDisconnect):
+                print(f"Live stats socket error: {error}")
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Live stats socket error: {e}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        live_stats_broadcaster.unsubscribe(subscription)
+
 @app.get("/api/dashboard-data")
 async def get_dashboard_data(current_user: dict = Depends(get_current_user)):
     try:
         user_id = current_user["user_id"]
         
-        # Get user tournaments
-        user_tournaments = list(
-            tournaments_collection.find({"participants": user_id})
-            .sort("created_at", -1)
+        # Get user tournaments: latest registrations, then their cards in one $in
+        registrations = await (
+            registrations_collection.find({"user_id": user_id}, {"_id": 0, "tournament_id": 1})
+            .sort("registered_at", -1)
             .limit(5)
+            .to_list(length=5)
         )
-        
-        # Convert ObjectId to string
-        for tournament in user_tournaments:
-            tournament["_id"] = str(tournament["_id"])
+        tournament_ids = [registration["tournament_id"] for registration in registrations]
+        cards = await tournaments_collection.find(
+            {"tournament_id": {"$in": tournament_ids}}, TOURNAMENT_CARD_PROJECTION
+        ).to_list(length=len(tournament_ids))
+        cards_by_id = {card["tournament_id"]: card for card in cards}
+        user_tournaments = [cards_by_id[tid] for tid in tournament_ids if tid in cards_by_id]
         
         # Get user transactions
-        recent_transactions = list(
-            transactions_collection.find({"user_id": user_id})
+        recent_transactions = await (
+            transactions_collection.find({"user_id": user_id}, TRANSACTION_PROJECTION)
             .sort("created_at", -1)
             .limit(10)
+            .to_list(length=10)
         )
         
-        for transaction in recent_transactions:
-            transaction["_id"] = str(transaction["_id"])
-        
         # Calculate achievements based on real user data
         stats = current_user.get("stats", {})
         achievements = [
@@ -542,31 +846,36 @@ async def get_dashboard_data(current_user: dict = Depends(get_current_user)):
                 "wins": daily_wins
             })
         
-        return {
+        return FastJSONResponse({
             "stats": stats,
             "recent_tournaments": user_tournaments,
             "achievements": achievements,
             "recent_transactions": recent_transactions,
             "weekly_progress": weekly_progress,
             "wallet_balance": current_user.get("wallet_balance", 0)
-        }
+        })
     except Exception as e:
         print(f"Get dashboard data error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch dashboard data")
 
 @app.get("/api/wallet/transactions")
-async def get_wallet_transactions(current_user: dict = Depends(get_current_user)):
+async def get_wallet_transactions(fields: Optional[str] = None, current_user: dict = Depends(get_current_principal)):
     try:
-        transactions = list(
-            transactions_collection.find({"user_id": current_user["user_id"]})
+        try:
+            fields_projection = projection(fields, TRANSACTION_FIELDS, TRANSACTION_FIELDS)
+        except InvalidFields as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        transactions = await (
+            transactions_collection.find({"user_id": current_user["user_id"]}, fields_projection)
             .sort("created_at", -1)
             .limit(50)
+            .to_list(length=50)
         )
-        
-        for transaction in transactions:
-            transaction["_id"] = str(transaction["_id"])
             
-        return {"transactions": transactions}
+        return FastJSONResponse({"transactions": transactions})
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Get transactions error: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch transactions")
@@ -579,10 +888,11 @@ async def add_funds(amount_data: dict, current_user: dict = Depends(get_current_
             raise HTTPException(status_code=400, detail="Invalid amount")
         
         # Update user wallet
-        users_collection.update_one(
+        await users_collection.update_one(
             {"user_id": current_user["user_id"]},
             {"$inc": {"wallet_balance": amount}}
         )
+        invalidate_user(current_user["user_id"])
         
         # Create transaction record
         transaction_doc = {
@@ -596,10 +906,10 @@ async def add_funds(amount_data: dict, current_user: dict = Depends(get_current_
             "payment_method": "UPI",
             "created_at": datetime.utcnow()
         }
-        transactions_collection.insert_one(transaction_doc)
+        await transactions_collection.insert_one(transaction_doc)
         
         # Get updated balance
-        updated_user = users_collection.find_one({"user_id": current_user["user_id"]})
+        updated_user = await users_collection.find_one({"user_id": current_user["user_id"]})
         
         return {
             "success": True,
@@ -686,7 +996,7 @@ async def generate_payment_qr(payment_data: dict, current_user: dict = Depends(g
             "created_at": datetime.utcnow()
         }
         
-        payments_collection.insert_one(payment_doc)
+        await payments_collection.insert_one(payment_doc)
         
         return {
             "success": True,
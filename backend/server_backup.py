@@ -1,7 +1,9 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Header, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument
+from pymongo.errors import DuplicateKeyError, BulkWriteError
 from pydantic import BaseModel, EmailStr
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -19,6 +21,17 @@ from io import BytesIO
 import asyncio
 import numpy as np
 import random
+from user_cache import get_cached_user, cache_user, invalidate_user
+from registration_batcher import RegistrationBatcher
+from indexes import ensure_indexes
+from pagination import KEYSET_SORT, REGISTRATION_KEYSET_SORT, InvalidCursor, apply_cursor, next_cursor
+from leaderboard_profiles import attach_profiles, refresh_user_profile, run_profile_sync_loop
+from segmented_leaderboards import board_id, resolve_board, get_board, record_match_results
+from live_stats import bump_live_stats, tournament_deltas, read_live_stats, run_reconcile_loop_sync as run_live_stats_reconcile_loop
+from response_cache import response_cache, install_response_cache, NO_STORE_HEADERS
+from serialization import FastJSONResponse, NO_ID, dumps
+from projections import projection, InvalidFields, TOURNAMENT_CARD_FIELDS, TOURNAMENT_FIELDS, KEYSET_FIELDS
+from dashboard_cache import get_cached_dashboard, cache_dashboard, invalidate_dashboard
 
 # Free Fire API configuration
 FREE_FIRE_API_BASE = "https://region-info-api.vercel.app"
@@ -72,9 +85,13 @@ load_dotenv()
 # Initialize FastAPI app
 app = FastAPI(
     title="Tournament Platform API", 
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
+# ETag/304 response cache for the public read routes; add CORS after it so CORS stays outermost
+install_response_cache(app)
+
 # Add CORS middleware - temporarily disabled for testing
 # app.add_middleware(
 #     CORSMiddleware,
@@ -97,6 +114,30 @@ matches_collection = db.matches
 payments_collection = db.payments
 notifications_collection = db.notifications
 leaderboards_collection = db.leaderboards
+leaderboard_segments_collection = db.leaderboard_segments
+token_versions_collection = db.token_versions
+
+@app.on_event("startup")
+def ensure_database_indexes():
+    ensure_indexes(db)
+
+# Background loops started at startup; held here so they aren't garbage-collected while pending
+background_tasks: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def start_leaderboard_profile_sync():
+    background_tasks.append(asyncio.create_task(run_profile_sync_loop(db)))
+
+@app.on_event("startup")
+async def start_live_stats_reconcile():
+    background_tasks.append(asyncio.create_task(run_live_stats_reconcile_loop(db)))
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
 
 # Security setup
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -107,6 +148,11 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 
+# Tournament join batching: coalesce joins per tournament into one insert_many + one counter update
+REGISTRATION_BATCHING_ENABLED = os.getenv("REGISTRATION_BATCHING_ENABLED", "true").lower() == "true"
+REGISTRATION_BATCH_WINDOW_MS = float(os.getenv("REGISTRATION_BATCH_WINDOW_MS", 5))
+REGISTRATION_BATCH_MAX_SIZE = int(os.getenv("REGISTRATION_BATCH_MAX_SIZE", 500))
+
 # Pydantic models
 class UserCreate(BaseModel):
     email: EmailStr
@@ -173,7 +219,26 @@ class AdminStats(BaseModel):
 class FreeFrieUserVerify(BaseModel):
     free_fire_uid: str
 
+class MatchResult(BaseModel):
+    user_id: str
+    placement: int
+    kills: int = 0
+    damage_dealt: int = 0
+    survival_time: int = 0
+    earnings: float = 0
+    match_date: Optional[datetime] = None
+
+class MatchResultsSubmit(BaseModel):
+    results: List[MatchResult]
+
 # Utility functions
+def paginated_query(filter_query: dict, cursor: Optional[str], field: str = "created_at") -> dict:
+    """Apply a keyset cursor to a listing filter, answering 400 for a malformed cursor"""
+    try:
+        return apply_cursor(filter_query, cursor, field)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -194,13 +259,21 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
         user_id: str = payload.get("sub")
         if user_id is None:
             raise HTTPException(status_code=401, detail="Invalid token")
+        user = get_cached_user(user_id)
+        if user is not None:
+            return user
         user = users_collection.find_one({"user_id": user_id})
         if user is None:
             raise HTTPException(status_code=401, detail="User not found")
+        cache_user(user)
         return user
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
 
+def revoke_user_tokens(user_id: str):
+    """Bump the user's token version so stateless claims tokens issued before now stop being trusted"""
+    token_versions_collection.update_one({"user_id": user_id}, {"$inc": {"version": 1}}, upsert=True)
+
 # AI-Powered Analytics Functions
 def calculate_player_skill_score(player_stats: Dict[str, Any]) -> float:
     """Calculate a comprehensive skill score for matchmaking"""
@@ -1498,6 +1571,8 @@ async def register(user_data: UserCreate):
     }
     
     users_collection.insert_one(user_doc)
+    bump_live_stats(db.live_stats, total_users=1)
+    response_cache.invalidate("/api/live-stats")
     
     # Create access token
     access_token = create_access_token(data={"sub": user_id})
@@ -1556,6 +1631,7 @@ async def login(user_data: UserLogin):
             {"user_id": user["user_id"]},
             {"$set": {"is_admin": True, "updated_at": datetime.utcnow()}}
         )
+    invalidate_user(user["user_id"])
     
     access_token = create_access_token(data={"sub": user["user_id"]})
     
@@ -1607,6 +1683,8 @@ async def create_tournament(tournament_data: TournamentCreate, current_user: dic
     }
     
     tournaments_collection.insert_one(tournament_doc)
+    bump_live_stats(db.live_stats, **tournament_deltas(None, tournament_doc))
+    response_cache.invalidate("/api/tournaments", "/api/live-stats")
     
     return {"message": "Tournament created successfully", "tournament_id": tournament_id}
 
@@ -1617,8 +1695,16 @@ async def get_tournaments(
     game_type: Optional[str] = None,
     country: Optional[str] = None,
     mode: Optional[str] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None
 ):
+    # Card-level fields by default; `fields=` narrows or widens within TOURNAMENT_FIELDS
+    try:
+        fields_projection = projection(fields, TOURNAMENT_CARD_FIELDS, TOURNAMENT_FIELDS, required=KEYSET_FIELDS)
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     # Build filter query
     filter_query = {}
     if game_type:
@@ -1630,33 +1716,22 @@ async def get_tournaments(
     if status:
         filter_query["status"] = status
     
-    # Get tournaments
-    tournaments = list(tournaments_collection.find(filter_query).skip(skip).limit(limit).sort("created_at", -1))
-    
-    # Remove MongoDB ObjectIds and format response
-    for tournament in tournaments:
-        tournament.pop("_id", None)
-        # Format dates for frontend
-        tournament["start_time"] = tournament["start_time"].isoformat()
-        tournament["registration_deadline"] = tournament["registration_deadline"].isoformat()
-        tournament["created_at"] = tournament["created_at"].isoformat()
-        tournament["updated_at"] = tournament["updated_at"].isoformat()
+    # Get tournaments: keyset pagination when a cursor is given, legacy skip otherwise
+    if cursor:
+        tournaments = list(tournaments_collection.find(paginated_query(filter_query, cursor), fields_projection).sort(KEYSET_SORT).limit(limit))
+    else:
+        tournaments = list(tournaments_collection.find(filter_query, fields_projection).sort(KEYSET_SORT).skip(skip).limit(limit))
     
-    return {"tournaments": tournaments, "total": len(tournaments)}
+    # _id is kept for the cursor; the response class serializes ObjectId and datetime as-is
+    return FastJSONResponse({"tournaments": tournaments, "total": len(tournaments), "next_cursor": next_cursor(tournaments, limit)})
 
 @app.get("/api/tournaments/{tournament_id}")
 async def get_tournament(tournament_id: str):
-    tournament = tournaments_collection.find_one({"tournament_id": tournament_id})
+    tournament = tournaments_collection.find_one({"tournament_id": tournament_id}, NO_ID)
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
     
-    tournament.pop("_id", None)
-    tournament["start_time"] = tournament["start_time"].isoformat()
-    tournament["registration_deadline"] = tournament["registration_deadline"].isoformat()
-    tournament["created_at"] = tournament["created_at"].isoformat()
-    tournament["updated_at"] = tournament["updated_at"].isoformat()
-    
-    return tournament
+    return FastJSONResponse(tournament)
 
 @app.post("/api/auth/verify-freefire")
 async def verify_free_fire_uid(verify_data: FreeFrieUserVerify, current_user: dict = Depends(get_current_user)):
@@ -1676,6 +1751,9 @@ async def verify_free_fire_uid(verify_data: FreeFrieUserVerify, current_user: di
                 }
             }
         )
+        invalidate_user(current_user["user_id"])
+        refresh_user_profile(leaderboards_collection, {"user_id": current_user["user_id"], "free_fire_data": ff_user_data})
+        response_cache.invalidate("/api/leaderboards")
         
         return {
             "message": "Free Fire UID verified successfully",
@@ -1692,11 +1770,11 @@ async def create_payment_qr(payment_data: PaymentCreate, current_user: dict = De
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
     
-    # Check if user already registered
-    existing_registration = registrations_collection.find_one({
-        "tournament_id": payment_data.tournament_id,
-        "user_id": current_user["user_id"]
-    })
+    # Check if user already registered (covered by the unique tournament/user index)
+    existing_registration = registrations_collection.find_one(
+        {"tournament_id": payment_data.tournament_id, "user_id": current_user["user_id"]},
+        {"_id": 0, "tournament_id": 1}
+    )
     if existing_registration:
         raise HTTPException(status_code=400, detail="Already registered for this tournament")
     
@@ -1758,23 +1836,19 @@ async def check_payment(order_id: str, current_user: dict = Depends(get_current_
         if status_data["status"] == "success":
             tournament_id = payment["tournament_id"]
             
-            # Check if not already registered
-            existing_registration = registrations_collection.find_one({
+            # Create registration; a repeat status poll hits the unique index instead of a pre-read
+            registration_doc = {
+                "registration_id": str(uuid.uuid4()),
                 "tournament_id": tournament_id,
-                "user_id": current_user["user_id"]
-            })
-            
-            if not existing_registration:
-                # Create registration
-                registration_doc = {
-                    "registration_id": str(uuid.uuid4()),
-                    "tournament_id": tournament_id,
-                    "user_id": current_user["user_id"],
-                    "payment_order_id": order_id,
-                    "registered_at": datetime.utcnow(),
-                    "status": "confirmed"
-                }
+                "user_id": current_user["user_id"],
+                "payment_order_id": order_id,
+                "registered_at": datetime.utcnow(),
+                "status": "confirmed"
+            }
+            try:
                 registrations_collection.insert_one(registration_doc)
+                bump_live_stats(db.live_stats, total_registrations=1)
+                invalidate_dashboard(current_user["user_id"])
                 
                 # Update tournament participant count
                 tournaments_collection.update_one(
@@ -1784,6 +1858,8 @@ async def check_payment(order_id: str, current_user: dict = Depends(get_current_
                 
                 # Update user wallet balance (add any refund if needed)
                 # For now, just track successful payment
+            except DuplicateKeyError:
+                pass
         
         return {
             "order_id": order_id,
@@ -1794,73 +1870,323 @@ async def check_payment(order_id: str, current_user: dict = Depends(get_current_
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to check payment status: {str(e)}")
 
-@app.post("/api/tournaments/{tournament_id}/register")
-async def register_for_tournament(tournament_id: str, current_user: dict = Depends(get_current_user)):
-    """Register for a tournament (free tournaments or with confirmed payment)"""
+def reserve_tournament_slot(tournament_id: str, free_only: bool = False) -> bool:
+    """
+    Atomically take one slot if the tournament is open and not full.
+    The capacity check and the increment happen in a single conditional update, so it can't oversell.
+    """
+    slot_filter = {
+        "tournament_id": tournament_id,
+        "registration_deadline": {"$gte": datetime.utcnow()},
+        "$expr": {"$lt": ["$current_participants", "$max_participants"]}
+    }
+    if free_only:
+        slot_filter["entry_fee"] = 0
+    reserved = tournaments_collection.find_one_and_update(
+        slot_filter,
+        {"$inc": {"current_participants": 1}},
+        projection={"_id": 0, "tournament_id": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    return reserved is not None
+
+def release_tournament_slot(tournament_id: str):
+    tournaments_collection.update_one(
+        {"tournament_id": tournament_id, "current_participants": {"$gt": 0}},
+        {"$inc": {"current_participants": -1}}
+    )
+
+def registration_response(registration: dict) -> dict:
+    return {"message": "Successfully registered for tournament", "registration_id": registration["registration_id"]}
+
+def free_registration_refusal(tournament_id: str) -> HTTPException:
+    """Explain why a free-tournament slot could not be reserved"""
     tournament = tournaments_collection.find_one({"tournament_id": tournament_id})
     if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
-    
-    # Check if tournament is full
-    if tournament["current_participants"] >= tournament["max_participants"]:
-        raise HTTPException(status_code=400, detail="Tournament is full")
-    
-    # Check if registration deadline passed
+        return HTTPException(status_code=404, detail="Tournament not found")
+    if tournament["entry_fee"] != 0:
+        # For paid tournaments, require payment first
+        return HTTPException(status_code=400, detail="Payment required for this tournament. Use /api/payments/create-qr endpoint first.")
     if datetime.utcnow() > tournament["registration_deadline"]:
-        raise HTTPException(status_code=400, detail="Registration deadline has passed")
-    
-    # Check if user already registered
-    existing_registration = registrations_collection.find_one({
-        "tournament_id": tournament_id,
-        "user_id": current_user["user_id"]
-    })
-    if existing_registration:
-        raise HTTPException(status_code=400, detail="Already registered for this tournament")
+        return HTTPException(status_code=400, detail="Registration deadline has passed")
+    return HTTPException(status_code=400, detail="Tournament is full")
+
+def existing_registration_result(registration: dict, idempotency_key: Optional[str]) -> Any:
+    """A retry carrying the original Idempotency-Key gets its original answer; anything else is a duplicate"""
+    if idempotency_key and registration.get("idempotency_key") == idempotency_key:
+        return registration_response(registration)
+    return HTTPException(status_code=400, detail="Already registered for this tournament")
+
+def commit_registration_batch(tournament_id: str, requests: List[dict]) -> List[Any]:
+    """
+    Commit a batch of free-tournament joins with one read of existing registrations,
+    one slot reservation, one insert_many and (only if some inserts lost a race) one
+    counter correction. Returns a registration response or an HTTPException per request, in order.
+    """
+    results: List[Any] = [None] * len(requests)
+    
+    # Only the first request per user competes for a slot; repeats are resolved afterwards
+    first_index: Dict[str, int] = {}
+    contenders = []
+    for index, request in enumerate(requests):
+        if request["user_id"] not in first_index:
+            first_index[request["user_id"]] = index
+            contenders.append(index)
+    
+    # Users already registered (client retries) are answered up front so they don't take a slot
+    existing = {
+        registration["user_id"]: registration
+        for registration in registrations_collection.find({
+            "tournament_id": tournament_id,
+            "user_id": {"$in": [requests[index]["user_id"] for index in contenders]}
+        })
+    }
+    newcomers = []
+    for index in contenders:
+        registration = existing.get(requests[index]["user_id"])
+        if registration is not None:
+            results[index] = existing_registration_result(registration, requests[index].get("idempotency_key"))
+        else:
+            newcomers.append(index)
+    
+    # Take up to len(newcomers) slots in one atomic update, capped at max_participants
+    wanted = len(newcomers)
+    before = None
+    granted = 0
+    if newcomers:
+        before = tournaments_collection.find_one_and_update(
+            {
+                "tournament_id": tournament_id,
+                "entry_fee": 0,
+                "registration_deadline": {"$gte": datetime.utcnow()},
+                "$expr": {"$lt": ["$current_participants", "$max_participants"]}
+            },
+            [{"$set": {"current_participants": {"$max": [
+                "$current_participants",
+                {"$min": ["$max_participants", {"$add": ["$current_participants", wanted]}]}
+            ]}}}],
+            projection={"_id": 0, "current_participants": 1, "max_participants": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+    if before is not None:
+        granted = max(0, min(before["max_participants"], before["current_participants"] + wanted) - before["current_participants"])
     
-    # For free tournaments (entry_fee = 0)
-    if tournament["entry_fee"] == 0:
-        registration_doc = {
+    admitted, refused = newcomers[:granted], newcomers[granted:]
+    now = datetime.utcnow()
+    documents = [
+        {
             "registration_id": str(uuid.uuid4()),
             "tournament_id": tournament_id,
-            "user_id": current_user["user_id"],
+            "user_id": requests[index]["user_id"],
             "payment_order_id": None,
-            "registered_at": datetime.utcnow(),
+            "idempotency_key": requests[index].get("idempotency_key"),
+            "registered_at": now,
             "status": "confirmed"
         }
-        registrations_collection.insert_one(registration_doc)
-        
-        # Update participant count
+        for index in admitted
+    ]
+    
+    failed_positions = set()
+    if documents:
+        try:
+            registrations_collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed_positions.add(write_error["index"])
+                if write_error.get("code") != 11000:
+                    results[admitted[write_error["index"]]] = HTTPException(status_code=500, detail="Registration failed")
+        except Exception as e:
+            # Network/write-concern failure after the reservation: give every slot back and answer 500;
+            # a retry either inserts or is answered from the registration that did land
+            print(f"Registration batch insert for {tournament_id} failed: {e}")
+            tournaments_collection.update_one(
+                {"tournament_id": tournament_id},
+                {"$inc": {"current_participants": -granted}}
+            )
+            for index in range(len(requests)):
+                if results[index] is None:
+                    results[index] = HTTPException(status_code=500, detail="Registration failed")
+            return results
+    
+    if failed_positions:
+        # Give back the slots taken for rows that weren't inserted
         tournaments_collection.update_one(
             {"tournament_id": tournament_id},
-            {"$inc": {"current_participants": 1}}
+            {"$inc": {"current_participants": -len(failed_positions)}}
         )
-        
-        return {"message": "Successfully registered for tournament", "registration_id": registration_doc["registration_id"]}
-    else:
-        # For paid tournaments, require payment first
-        raise HTTPException(status_code=400, detail="Payment required for this tournament. Use /api/payments/create-qr endpoint first.")
+    
+    for position, index in enumerate(admitted):
+        if position not in failed_positions:
+            results[index] = registration_response(documents[position])
+            invalidate_dashboard(documents[position]["user_id"])
+    if len(documents) > len(failed_positions):
+        bump_live_stats(db.live_stats, total_registrations=len(documents) - len(failed_positions))
+    
+    # Duplicate-key failures lost a race with a join made outside this batch since the read above
+    raced = [index for index in admitted if results[index] is None]
+    if raced:
+        winners = {
+            registration["user_id"]: registration
+            for registration in registrations_collection.find({
+                "tournament_id": tournament_id,
+                "user_id": {"$in": [requests[index]["user_id"] for index in raced]}
+            })
+        }
+        for index in raced:
+            registration = winners.get(requests[index]["user_id"])
+            results[index] = (
+                existing_registration_result(registration, requests[index].get("idempotency_key")) if registration is not None
+                else HTTPException(status_code=500, detail="Registration failed")
+            )
+    
+    if refused:
+        refusal = (
+            free_registration_refusal(tournament_id) if before is None
+            else HTTPException(status_code=400, detail="Tournament is full")
+        )
+        for index in refused:
+            results[index] = HTTPException(status_code=refusal.status_code, detail=refusal.detail)
+    
+    # Repeats of a user within this batch mirror that user's first request
+    for index, request in enumerate(requests):
+        if results[index] is not None:
+            continue
+        first = results[first_index[request["user_id"]]]
+        key = request.get("idempotency_key")
+        if isinstance(first, HTTPException):
+            results[index] = HTTPException(status_code=first.status_code, detail=first.detail)
+        elif key and key == requests[first_index[request["user_id"]]].get("idempotency_key"):
+            results[index] = first
+        else:
+            results[index] = HTTPException(status_code=400, detail="Already registered for this tournament")
+    
+    return results
 
-@app.get("/api/user/tournaments")
-async def get_user_tournaments(current_user: dict = Depends(get_current_user)):
-    """Get user's registered tournaments"""
-    # Get user's registrations
-    registrations = list(registrations_collection.find({"user_id": current_user["user_id"]}))
+registration_batcher = RegistrationBatcher(
+    commit_registration_batch,
+    window_ms=REGISTRATION_BATCH_WINDOW_MS,
+    max_batch_size=REGISTRATION_BATCH_MAX_SIZE
+)
+
+def replay_or_reject_registration(tournament_id: str, user_id: str, idempotency_key: Optional[str]) -> dict:
+    """An earlier request with the same Idempotency-Key gets its original answer; anything else is a duplicate"""
+    existing_registration = registrations_collection.find_one({"tournament_id": tournament_id, "user_id": user_id})
+    if existing_registration and idempotency_key and existing_registration.get("idempotency_key") == idempotency_key:
+        return registration_response(existing_registration)
+    raise HTTPException(status_code=400, detail="Already registered for this tournament")
+
+@app.post("/api/tournaments/{tournament_id}/register")
+async def register_for_tournament(
+    tournament_id: str,
+    current_user: dict = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None)
+):
+    """Register for a tournament (free tournaments or with confirmed payment)"""
+    user_id = current_user["user_id"]
+    
+    if REGISTRATION_BATCHING_ENABLED:
+        return await registration_batcher.submit(
+            tournament_id, {"user_id": user_id, "idempotency_key": idempotency_key}
+        )
     
-    # Get tournament details for each registration
-    user_tournaments = []
+    # Fast path: one conditional update reserves the slot
+    if not reserve_tournament_slot(tournament_id, free_only=True):
+        # Slow path only: work out why the reservation was refused
+        if registrations_collection.find_one({"tournament_id": tournament_id, "user_id": user_id}, {"_id": 1}):
+            return replay_or_reject_registration(tournament_id, user_id, idempotency_key)
+        raise free_registration_refusal(tournament_id)
+    
+    registration_doc = {
+        "registration_id": str(uuid.uuid4()),
+        "tournament_id": tournament_id,
+        "user_id": user_id,
+        "payment_order_id": None,
+        "idempotency_key": idempotency_key,
+        "registered_at": datetime.utcnow(),
+        "status": "confirmed"
+    }
+    try:
+        registrations_collection.insert_one(registration_doc)
+        bump_live_stats(db.live_stats, total_registrations=1)
+        invalidate_dashboard(user_id)
+    except DuplicateKeyError:
+        # Unique (tournament_id, user_id) index caught a duplicate: give the slot back
+        release_tournament_slot(tournament_id)
+        return replay_or_reject_registration(tournament_id, user_id, idempotency_key)
+    except Exception:
+        release_tournament_slot(tournament_id)
+        raise
+    
+    return registration_response(registration_doc)
+
+USER_TOURNAMENTS_MAX_PAGE = 200
+REGISTRATION_PAGE_PROJECTION = {"_id": 1, "tournament_id": 1, "status": 1, "registered_at": 1}
+
+def user_tournaments_page(user_id: str, cursor: Optional[str], limit: int, fields_projection: dict):
+    """One page of a player's history: a range scan over their registrations and one $in for the tournaments"""
+    registrations = list(
+        registrations_collection.find(paginated_query({"user_id": user_id}, cursor, "registered_at"), REGISTRATION_PAGE_PROJECTION)
+        .sort(REGISTRATION_KEYSET_SORT)
+        .limit(limit)
+    )
+    tournaments = {}
+    if registrations:
+        tournaments = {
+            tournament["tournament_id"]: tournament
+            for tournament in tournaments_collection.find(
+                {"tournament_id": {"$in": [registration["tournament_id"] for registration in registrations]}},
+                fields_projection
+            )
+        }
+    
+    page = []
     for registration in registrations:
-        tournament = tournaments_collection.find_one({"tournament_id": registration["tournament_id"]})
+        tournament = tournaments.get(registration["tournament_id"])
+        # Registrations for deleted tournaments are skipped but still advance the cursor
         if tournament:
-            tournament.pop("_id", None)
-            tournament["start_time"] = tournament["start_time"].isoformat()
-            tournament["registration_deadline"] = tournament["registration_deadline"].isoformat() 
-            tournament["created_at"] = tournament["created_at"].isoformat()
-            tournament["updated_at"] = tournament["updated_at"].isoformat()
             tournament["registration_status"] = registration["status"]
-            tournament["registered_at"] = registration["registered_at"].isoformat()
-            user_tournaments.append(tournament)
-    
-    return {"tournaments": user_tournaments}
+            tournament["registered_at"] = registration["registered_at"]
+            page.append(tournament)
+    return page, next_cursor(registrations, limit, "registered_at")
+
+def stream_user_tournaments(user_id: str, first_page: list, cursor: Optional[str], limit: int, fields_projection: dict):
+    """NDJSON lines for `first_page` and every page after it; runs in Starlette's threadpool"""
+    page = first_page
+    while True:
+        for tournament in page:
+            yield dumps(tournament) + b"\n"
+        if cursor is None:
+            return
+        page, cursor = user_tournaments_page(user_id, cursor, limit, fields_projection)
+
+@app.get("/api/user/tournaments")
+async def get_user_tournaments(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    accept: Optional[str] = Header(None),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Get user's registered tournaments, most recently joined first, one keyset page at a time.
+    With `Accept: application/x-ndjson` the whole history from `cursor` on is streamed instead,
+    one tournament per line, read `limit` registrations at a time.
+    """
+    try:
+        fields_projection = projection(fields, TOURNAMENT_CARD_FIELDS, TOURNAMENT_FIELDS, required=("tournament_id",))
+    except InvalidFields as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    limit = max(1, min(limit, USER_TOURNAMENTS_MAX_PAGE))
+    user_id = current_user["user_id"]
+    
+    # The first page is read up front so a bad cursor is still a 400 when streaming
+    page, following = user_tournaments_page(user_id, cursor, limit, fields_projection)
+    if accept and "application/x-ndjson" in accept:
+        return StreamingResponse(
+            stream_user_tournaments(user_id, page, following, limit, fields_projection),
+            media_type="application/x-ndjson"
+        )
+    return FastJSONResponse({"tournaments": page, "next_cursor": following})
 
 # AI-Powered API Endpoints
 @app.get("/api/ai/matchmaking-analysis")
@@ -2242,6 +2568,7 @@ async def get_admin_users(
     search: Optional[str] = None,
     is_verified: Optional[bool] = None,
     is_admin: Optional[bool] = None,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     """Get all users for admin management"""
@@ -2263,7 +2590,10 @@ async def get_admin_users(
             filter_query["is_admin"] = is_admin
         
         # Get users with pagination
-        users = list(users_collection.find(filter_query).skip(skip).limit(limit).sort("created_at", -1))
+        if cursor:
+            users = list(users_collection.find(paginated_query(filter_query, cursor)).sort(KEYSET_SORT).limit(limit))
+        else:
+            users = list(users_collection.find(filter_query).sort(KEYSET_SORT).skip(skip).limit(limit))
         total_count = users_collection.count_documents(filter_query)
         
         # Format users data
@@ -2294,15 +2624,20 @@ async def get_admin_users(
             }
             formatted_users.append(formatted_user)
         
+        following = next_cursor(users, limit)
         return {
             "users": formatted_users,
             "total_count": total_count,
+            "next_cursor": following,
             "page": {
                 "skip": skip,
                 "limit": limit,
-                "has_more": (skip + limit) < total_count
+                # skip is ignored in cursor mode, so only the cursor knows whether more follows
+                "has_more": following is not None if cursor else (skip + limit) < total_count
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get users: {str(e)}")
 
@@ -2336,6 +2671,8 @@ async def update_user(user_id: str, user_update: UserUpdate, current_user: dict
         if update_data:
             update_data["updated_at"] = datetime.utcnow()
             users_collection.update_one({"user_id": user_id}, {"$set": update_data})
+            invalidate_user(user_id)
+            revoke_user_tokens(user_id)
         
         return {"message": "User updated successfully"}
     except Exception as e:
@@ -2358,11 +2695,19 @@ async def delete_user(user_id: str, current_user: dict = Depends(get_current_use
             raise HTTPException(status_code=400, detail="Cannot delete admin users")
         
         # Delete user and related data
-        users_collection.delete_one({"user_id": user_id})
-        registrations_collection.delete_many({"user_id": user_id})
+        if users_collection.delete_one({"user_id": user_id}).deleted_count:
+            bump_live_stats(db.live_stats, total_users=-1)
+        invalidate_user(user_id)
+        revoke_user_tokens(user_id)
+        removed_registrations = registrations_collection.delete_many({"user_id": user_id}).deleted_count
+        if removed_registrations:
+            bump_live_stats(db.live_stats, total_registrations=-removed_registrations)
         matches_collection.delete_many({"user_id": user_id})
         payments_collection.delete_many({"user_id": user_id})
         leaderboards_collection.delete_many({"user_id": user_id})
+        leaderboard_segments_collection.delete_many({"user_id": user_id})
+        invalidate_dashboard(user_id)
+        response_cache.invalidate("/api/leaderboards", "/api/live-stats")
         
         return {"message": "User deleted successfully"}
     except Exception as e:
@@ -2374,6 +2719,7 @@ async def get_admin_tournaments(
     limit: int = 20,
     status: Optional[str] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     """Get all tournaments for admin management"""
@@ -2389,7 +2735,10 @@ async def get_admin_tournaments(
             filter_query["name"] = {"$regex": search, "$options": "i"}
         
         # Get tournaments with pagination
-        tournaments = list(tournaments_collection.find(filter_query).skip(skip).limit(limit).sort("created_at", -1))
+        if cursor:
+            tournaments = list(tournaments_collection.find(paginated_query(filter_query, cursor)).sort(KEYSET_SORT).limit(limit))
+        else:
+            tournaments = list(tournaments_collection.find(filter_query).sort(KEYSET_SORT).skip(skip).limit(limit))
         total_count = tournaments_collection.count_documents(filter_query)
         
         # Format tournament data
@@ -2423,15 +2772,19 @@ async def get_admin_tournaments(
             }
             formatted_tournaments.append(formatted_tournament)
         
+        following = next_cursor(tournaments, limit)
         return {
             "tournaments": formatted_tournaments,
             "total_count": total_count,
+            "next_cursor": following,
             "page": {
                 "skip": skip,
                 "limit": limit,
-                "has_more": (skip + limit) < total_count
+                "has_more": following is not None if cursor else (skip + limit) < total_count
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get tournaments: {str(e)}")
 
@@ -2468,12 +2821,42 @@ async def update_tournament(tournament_id: str, tournament_update: TournamentUpd
         
         if update_data:
             update_data["updated_at"] = datetime.utcnow()
-            tournaments_collection.update_one({"tournament_id": tournament_id}, {"$set": update_data})
+            # The pre-image from the same write keeps the counter deltas exact under concurrent edits
+            before = tournaments_collection.find_one_and_update(
+                {"tournament_id": tournament_id},
+                {"$set": update_data},
+                projection={"_id": 0, "status": 1, "prize_pool": 1},
+                return_document=ReturnDocument.BEFORE
+            )
+            if before is not None:
+                bump_live_stats(db.live_stats, **tournament_deltas(before, {**before, **update_data}))
+            response_cache.invalidate("/api/tournaments", "/api/live-stats")
         
         return {"message": "Tournament updated successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update tournament: {str(e)}")
 
+@app.post("/api/admin/tournaments/{tournament_id}/results")
+async def submit_match_results(tournament_id: str, submission: MatchResultsSubmit, current_user: dict = Depends(get_current_user)):
+    """Record match results (admin only); every leaderboard they touch is updated in the same call"""
+    if not current_user.get("is_admin", False):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    try:
+        tournament = tournaments_collection.find_one({"tournament_id": tournament_id}, {"_id": 0, "tournament_id": 1, "game_type": 1})
+        if not tournament:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        
+        matches = record_match_results(db, tournament, [result.dict() for result in submission.results])
+        invalidate_dashboard(*(result.user_id for result in submission.results))
+        response_cache.invalidate("/api/leaderboards")
+        
+        return {"message": "Match results recorded successfully", "recorded": len(matches)}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to record match results: {str(e)}")
+
 @app.delete("/api/admin/tournaments/{tournament_id}")
 async def delete_tournament(tournament_id: str, current_user: dict = Depends(get_current_user)):
     """Delete tournament (admin only)"""
@@ -2491,10 +2874,15 @@ async def delete_tournament(tournament_id: str, current_user: dict = Depends(get
             raise HTTPException(status_code=400, detail="Cannot delete tournament that has started or completed")
         
         # Delete tournament and related data
-        tournaments_collection.delete_one({"tournament_id": tournament_id})
-        registrations_collection.delete_many({"tournament_id": tournament_id})
+        if tournaments_collection.delete_one({"tournament_id": tournament_id}).deleted_count:
+            bump_live_stats(db.live_stats, **tournament_deltas(existing_tournament, None))
+        removed_registrations = registrations_collection.delete_many({"tournament_id": tournament_id}).deleted_count
+        if removed_registrations:
+            bump_live_stats(db.live_stats, total_registrations=-removed_registrations)
         matches_collection.delete_many({"tournament_id": tournament_id})
         payments_collection.delete_many({"tournament_id": tournament_id})
+        leaderboard_segments_collection.delete_many({"board_id": board_id("tournament", tournament_id)})
+        response_cache.invalidate("/api/tournaments", "/api/leaderboards", "/api/live-stats")
         
         return {"message": "Tournament deleted successfully"}
     except Exception as e:
@@ -2505,6 +2893,7 @@ async def get_admin_payments(
     skip: int = 0,
     limit: int = 20,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(get_current_user)
 ):
     """Get all payments for admin management"""
@@ -2518,7 +2907,10 @@ async def get_admin_payments(
             filter_query["status"] = status
         
         # Get payments with pagination
-        payments = list(payments_collection.find(filter_query).skip(skip).limit(limit).sort("created_at", -1))
+        if cursor:
+            payments = list(payments_collection.find(paginated_query(filter_query, cursor)).sort(KEYSET_SORT).limit(limit))
+        else:
+            payments = list(payments_collection.find(filter_query).sort(KEYSET_SORT).skip(skip).limit(limit))
         total_count = payments_collection.count_documents(filter_query)
         
         # Format payment data
@@ -2542,28 +2934,54 @@ async def get_admin_payments(
             }
             formatted_payments.append(formatted_payment)
         
+        following = next_cursor(payments, limit)
         return {
             "payments": formatted_payments,
             "total_count": total_count,
+            "next_cursor": following,
             "page": {
                 "skip": skip,
                 "limit": limit,
-                "has_more": (skip + limit) < total_count
+                "has_more": following is not None if cursor else (skip + limit) < total_count
             }
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get payments: {str(e)}")
 
 @app.get("/api/leaderboards")
 async def get_leaderboards(
-    game_type: Optional[str] = "free_fire",
+    game_type: Optional[str] = None,
     tournament_id: Optional[str] = None,
+    category: Optional[str] = None,
+    region: Optional[str] = None,
+    season: Optional[str] = None,
     limit: int = 50
 ):
     """Get real leaderboards based on actual tournament performance"""
+    # A lone segment parameter (e.g. tournament_id) selects its board; see resolve_board
+    try:
+        board = resolve_board(category, {"region": region, "game_type": game_type, "season": season, "tournament": tournament_id})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if board != "overall":
+        # Precomputed as match results are recorded: one indexed read
+        leaderboard_data = get_board(db, board, limit)
+        return {
+            "leaderboard": leaderboard_data,
+            "category": board.split(":", 1)[0],
+            "board": board,
+            "game_type": game_type,
+            "tournament_id": tournament_id,
+            "total_entries": len(leaderboard_data)
+        }
+    
     try:
-        # Get leaderboard data from database
-        leaderboard_data = list(leaderboards_collection.find({}).sort("rank", 1).limit(limit))
+        # Level and avatar are denormalized onto the rows, so this is normally the only query
+        leaderboard_data = list(leaderboards_collection.find({}, {"_id": 0}).sort("rank", 1).limit(limit))
+        leaderboard_data = attach_profiles(users_collection, leaderboard_data)
         
         if not leaderboard_data:
             # If no leaderboard data, return empty results
@@ -2577,24 +2995,21 @@ async def get_leaderboards(
         # Format leaderboard data
         formatted_leaderboard = []
         for entry in leaderboard_data:
-            # Get user details
-            user = users_collection.find_one({"user_id": entry["user_id"]})
-            if user:
-                formatted_entry = {
-                    "rank": entry["rank"],
-                    "user_id": entry["user_id"],
-                    "username": entry["username"],
-                    "full_name": entry["full_name"],
-                    "skill_rating": entry.get("skill_rating", 0),
-                    "total_earnings": entry.get("total_earnings", 0),
-                    "tournaments_played": entry.get("tournaments_played", 0),
-                    "tournaments_won": entry.get("tournaments_won", 0),
-                    "avg_placement": entry.get("avg_placement", 0),
-                    "total_kills": entry.get("total_kills", 0),
-                    "level": user.get("free_fire_data", {}).get("level", 0),
-                    "avatar": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
-                }
-                formatted_leaderboard.append(formatted_entry)
+            formatted_entry = {
+                "rank": entry["rank"],
+                "user_id": entry["user_id"],
+                "username": entry["username"],
+                "full_name": entry["full_name"],
+                "skill_rating": entry.get("skill_rating", 0),
+                "total_earnings": entry.get("total_earnings", 0),
+                "tournaments_played": entry.get("tournaments_played", 0),
+                "tournaments_won": entry.get("tournaments_won", 0),
+                "avg_placement": entry.get("avg_placement", 0),
+                "total_kills": entry.get("total_kills", 0),
+                "level": entry["level"],
+                "avatar": entry["avatar"]
+            }
+            formatted_leaderboard.append(formatted_entry)
         
         return {
             "leaderboard": formatted_leaderboard,
@@ -2604,56 +3019,37 @@ async def get_leaderboards(
         }
         
     except Exception as e:
-        # Fallback to empty leaderboard on error
-        return {
+        # Fallback to empty leaderboard on error; no-store keeps it out of the response cache
+        return FastJSONResponse({
             "leaderboard": [],
             "game_type": game_type,
             "tournament_id": tournament_id,
             "error": f"Failed to load leaderboard: {str(e)}"
-        }
+        }, headers=NO_STORE_HEADERS)
 
 @app.get("/api/live-stats")
 async def get_live_stats():
     """Get real-time platform statistics from database"""
     try:
-        # Get live stats from database
-        live_stats = db.live_stats.find_one({"stats_id": "global_stats"})
-        
-        if live_stats:
-            # Remove MongoDB ID and format response
-            live_stats.pop("_id", None)
-            return {
-                "totalTournaments": live_stats.get("total_tournaments", 0),
-                "totalPrizePool": live_stats.get("total_prize_pool", 0),
-                "activePlayers": live_stats.get("total_users", 0),
-                "liveMatches": live_stats.get("active_tournaments", 0),
-                "updated_at": live_stats.get("updated_at").isoformat() if live_stats.get("updated_at") else None
-            }
-        else:
-            # Calculate stats on the fly if no cached stats
-            total_tournaments = tournaments_collection.count_documents({})
-            active_tournaments = tournaments_collection.count_documents({"status": "live"})
-            total_users = users_collection.count_documents({})
-            
-            total_prize_pool = 0
-            for tournament in tournaments_collection.find({}):
-                total_prize_pool += tournament.get("prize_pool", 0)
-            
-            return {
-                "totalTournaments": total_tournaments,
-                "totalPrizePool": total_prize_pool,
-                "activePlayers": total_users,
-                "liveMatches": active_tournaments,
-                "updated_at": datetime.utcnow().isoformat()
-            }
-    except Exception as e:
-        # Return realistic default stats on error
+        # Incrementally maintained counters, cached for a few seconds;
+        # the first read after a fresh install builds the document
+        live_stats = read_live_stats(db)
         return {
+            "totalTournaments": live_stats.get("total_tournaments", 0),
+            "totalPrizePool": live_stats.get("total_prize_pool", 0),
+            "activePlayers": live_stats.get("total_users", 0),
+            "liveMatches": live_stats.get("active_tournaments", 0),
+            "updated_at": live_stats.get("updated_at").isoformat() if live_stats.get("updated_at") else None
+        }
+    except Exception as e:
+        print(f"Get live stats error: {e}")
+        # Return realistic default stats on error; no-store keeps them out of the response cache
+        return FastJSONResponse({
             "totalTournaments": 150,
             "totalPrizePool": 5000000,
             "activePlayers": 45000,
             "liveMatches": 200
-        }
+        }, headers=NO_STORE_HEADERS)
 
 @app.get("/api/ai-predictions")
 async def get_ai_predictions(current_user: dict = Depends(get_current_user)):
@@ -2704,25 +3100,114 @@ async def get_ai_predictions(current_user: dict = Depends(get_current_user)):
         print(f"Error getting AI predictions: {e}")
         return {"predictions": []}
 
+DASHBOARD_RECENT_TOURNAMENTS = 5
+
+
+def dashboard_tournaments_joined(user_id: str) -> int:
+    return registrations_collection.count_documents({"user_id": user_id})
+
+
+def dashboard_total_winnings(user_id: str) -> float:
+    totals = list(matches_collection.aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$group": {"_id": None, "earnings": {"$sum": "$earnings"}}}
+    ]))
+    return totals[0]["earnings"] if totals else 0
+
+
+def dashboard_current_rank(user_id: str) -> int:
+    user_leaderboard = leaderboards_collection.find_one({"user_id": user_id}, {"_id": 0, "rank": 1})
+    return user_leaderboard.get("rank", 999) if user_leaderboard else 999
+
+
+def dashboard_recent_tournaments(user_id: str) -> List[Dict[str, Any]]:
+    """Latest registrations joined to their tournament and this user's match result, in one aggregation"""
+    registrations = registrations_collection.aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$sort": {"registered_at": -1}},
+        {"$limit": DASHBOARD_RECENT_TOURNAMENTS},
+        {"$lookup": {
+            "from": tournaments_collection.name,
+            "let": {"tournament_id": "$tournament_id"},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$tournament_id", "$$tournament_id"]}}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "tournament_id": 1, "name": 1, "status": 1, "prize_pool": 1,
+                              "current_participants": 1, "max_participants": 1, "start_time": 1}}
+            ],
+            "as": "tournament"
+        }},
+        {"$lookup": {
+            "from": matches_collection.name,
+            "let": {"tournament_id": "$tournament_id"},
+            "pipeline": [
+                {"$match": {"user_id": user_id, "$expr": {"$eq": ["$tournament_id", "$$tournament_id"]}}},
+                {"$limit": 1},
+                {"$project": {"_id": 0, "placement": 1, "earnings": 1}}
+            ],
+            "as": "match"
+        }},
+        {"$project": {"_id": 0, "tournament": 1, "match": 1}}
+    ])
+    
+    recent_tournaments = []
+    for registration in registrations:
+        if not registration["tournament"]:
+            continue
+        tournament = registration["tournament"][0]
+        tournament_info = {
+            "id": tournament["tournament_id"],
+            "name": tournament["name"],
+            "status": tournament["status"],
+            "prize": tournament["prize_pool"],
+            "participants": f'{tournament["current_participants"]}/{tournament["max_participants"]}',
+            "date": tournament["start_time"].isoformat(),
+            "registered": True
+        }
+        if registration["match"]:
+            match_result = registration["match"][0]
+            tournament_info["result"] = {
+                "place": match_result["placement"],
+                "prize": match_result["earnings"]
+            }
+        recent_tournaments.append(tournament_info)
+    return recent_tournaments
+
+
+async def load_dashboard_summary(user_id: str) -> Dict[str, Any]:
+    """
+    Database-backed part of the dashboard: four independent queries run concurrently on the
+    default executor, so the cost stays flat however many tournaments the user has joined.
+    """
+    summary = get_cached_dashboard(user_id)
+    if summary is not None:
+        return summary
+    
+    loop = asyncio.get_running_loop()
+    tournaments_joined, total_winnings, current_rank, recent_tournaments = await asyncio.gather(
+        loop.run_in_executor(None, dashboard_tournaments_joined, user_id),
+        loop.run_in_executor(None, dashboard_total_winnings, user_id),
+        loop.run_in_executor(None, dashboard_current_rank, user_id),
+        loop.run_in_executor(None, dashboard_recent_tournaments, user_id),
+    )
+    summary = {
+        "tournaments_joined": tournaments_joined,
+        "total_winnings": total_winnings,
+        "current_rank": current_rank,
+        "recent_tournaments": recent_tournaments
+    }
+    cache_dashboard(user_id, summary)
+    return summary
+
 @app.get("/api/dashboard-data")
 async def get_dashboard_data(current_user: dict = Depends(get_current_user)):
     """Get comprehensive dashboard data for the current user"""
     try:
-        user_id = current_user["user_id"]
-        
-        # Get user's tournament registrations
-        user_registrations = list(registrations_collection.find({"user_id": user_id}))
-        
-        # Get user's match results
-        user_matches = list(matches_collection.find({"user_id": user_id}).sort("match_date", -1))
-        
-        # Calculate user statistics
-        tournaments_joined = len(user_registrations)
-        total_winnings = sum([match.get("earnings", 0) for match in user_matches])
-        
-        # Get user's rank from leaderboard
-        user_leaderboard = leaderboards_collection.find_one({"user_id": user_id})
-        current_rank = user_leaderboard.get("rank", 999) if user_leaderboard else 999
+        summary = await load_dashboard_summary(current_user["user_id"])
+        tournaments_joined = summary["tournaments_joined"]
+        total_winnings = summary["total_winnings"]
+        current_rank = summary["current_rank"]
+        recent_tournaments = summary["recent_tournaments"]
         
         # Calculate win rate from Free Fire data
         ff_data = current_user.get("free_fire_data", {})
@@ -2730,35 +3215,6 @@ async def get_dashboard_data(current_user: dict = Depends(get_current_user)):
         total_matches = ff_data.get("total_matches", 1)
         win_rate = round((wins / max(total_matches, 1)) * 100, 1)
         
-        # Get recent tournaments with details
-        recent_tournaments = []
-        for reg in user_registrations[-5:]:  # Last 5 registrations
-            tournament = tournaments_collection.find_one({"tournament_id": reg["tournament_id"]})
-            if tournament:
-                # Find match result for this tournament
-                match_result = matches_collection.find_one({
-                    "user_id": user_id,
-                    "tournament_id": reg["tournament_id"]
-                })
-                
-                tournament_info = {
-                    "id": tournament["tournament_id"],
-                    "name": tournament["name"],
-                    "status": tournament["status"],
-                    "prize": tournament["prize_pool"],
-                    "participants": f'{tournament["current_participants"]}/{tournament["max_participants"]}',
-                    "date": tournament["start_time"].isoformat(),
-                    "registered": True
-                }
-                
-                if match_result:
-                    tournament_info["result"] = {
-                        "place": match_result["placement"],
-                        "prize": match_result["earnings"]
-                    }
-                    
-                recent_tournaments.append(tournament_info)
-        
         # Generate achievements based on user performance
         achievements = [
             {"id": 1, "name": "Tournament Warrior", "description": "Join your first tournament", "earned": tournaments_joined > 0, "rarity": "common"},
@@ -0,0 +1,93 @@
+import asyncio
+import copy
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from fastapi import HTTPException
+
+_groups: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one execution; every caller gets its result
+    (or its own copy of the exception). The execution runs as its own task, so a caller that disconnects doesn't
+    cancel it for the others.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.shared += 1
+        try:
+            return await asyncio.shield(task)
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers) from e
+        except Exception as e:
+            raise _fresh_exception(e) from e
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "shared_results": self.shared,
+            "in_flight": len(self._in_flight),
+        }
+
+
+def _fresh_exception(e: Exception) -> Exception:
+    """
+    A new instance per caller: re-raising the shared one would let every caller append its own
+    traceback (and __context__) to the same object
+    """
+    try:
+        return type(e)(*e.args)
+    except Exception:
+        return copy.copy(e)
+
+
+def _call_key(kwargs: Dict[str, Any]) -> Hashable:
+    return tuple(sorted((name, repr(value)) for name, value in kwargs.items()))
+
+
+def single_flight(fn: Optional[Callable[..., Awaitable[Any]]] = None, *, response_class: Optional[type] = None):
+    """
+    Decorator for async route handlers whose result depends only on their parameters.
+    Concurrent requests with identical parameters share one execution.
+    Put it under the @app.get(...) line; FastAPI still sees the handler's own signature.
+
+    Handlers must return plain data, never a Response: a Response object carries per-request
+    state (middleware edits its headers), so sharing one between callers is unsafe. Pass
+    `response_class` to wrap the shared payload in a fresh response for each caller.
+    """
+    if fn is None:
+        return functools.partial(single_flight, response_class=response_class)
+    group = _groups.setdefault(fn.__name__, SingleFlight(fn.__name__))
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        result = await group.do(_call_key(kwargs) + (repr(args),), lambda: fn(*args, **kwargs))
+        return response_class(result) if response_class is not None else result
+
+    return wrapper
+
+
+def get_single_flight_stats() -> Dict[str, Any]:
+    groups = {name: group.stats() for name, group in _groups.items()}
+    return {
+        "shared_results": sum(group["shared_results"] for group in groups.values()),
+        "routes": groups,
+    }
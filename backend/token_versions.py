@@ -0,0 +1,42 @@
+import os
+import asyncio
+from typing import Dict
+from database import token_versions_collection
+
+# Compact revocation table for stateless claims tokens: user_id -> current token version.
+# Only users whose tokens were ever revoked have a row, so the table stays small.
+TOKEN_VERSION_REFRESH_SECONDS = float(os.getenv("TOKEN_VERSION_REFRESH_SECONDS", 10))
+
+_versions: Dict[str, int] = {}
+
+
+def current_version(user_id: str) -> int:
+    return _versions.get(user_id, 0)
+
+
+def is_current(user_id: str, token_version: int) -> bool:
+    """A claims token is trusted only if it was issued at the user's current version"""
+    return token_version >= _versions.get(user_id, 0)
+
+
+async def refresh_versions():
+    global _versions
+    rows = await token_versions_collection.find({}, {"_id": 0, "user_id": 1, "version": 1}).to_list(length=None)
+    _versions = {row["user_id"]: row["version"] for row in rows}
+
+
+async def run_refresh_loop():
+    """Pick up revocations written by other processes (bounded staleness of one interval)"""
+    while True:
+        try:
+            await refresh_versions()
+        except Exception as e:
+            print(f"Token version refresh error: {e}")
+        await asyncio.sleep(TOKEN_VERSION_REFRESH_SECONDS)
+
+
+def get_token_version_stats() -> Dict[str, float]:
+    return {
+        "tracked_users": len(_versions),
+        "refresh_seconds": TOKEN_VERSION_REFRESH_SECONDS,
+    }
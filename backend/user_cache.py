@@ -0,0 +1,29 @@
+import os
+from typing import Optional, Dict, Any
+from ttl_cache import TTLCache
+
+# Authenticated-principal cache keyed by the JWT `sub` (user_id).
+# Keep the TTL short: writes made by other processes are only seen after expiry.
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 10000))
+
+_principal_cache = TTLCache(maxsize=USER_CACHE_MAX_ENTRIES, ttl_seconds=USER_CACHE_TTL_SECONDS)
+
+
+def get_cached_user(user_id: str) -> Optional[Dict[str, Any]]:
+    user = _principal_cache.get(user_id)
+    # Hand out a shallow copy so a handler mutating its user dict can't poison the cache
+    return dict(user) if user is not None else None
+
+
+def cache_user(user: Dict[str, Any]):
+    _principal_cache.set(user["user_id"], dict(user))
+
+
+def invalidate_user(user_id: str):
+    """Call after any write to the user document"""
+    _principal_cache.invalidate(user_id)
+
+
+def get_user_cache_stats() -> Dict[str, Any]:
+    return _principal_cache.stats()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Dashboard Query Count Test
+Calls the legacy server's dashboard loader against a scratch database for a
+user with many registrations, counts the MongoDB commands it issues and times
+it next to the old per-registration lookups (2N+3 queries).
+
+Usage:
+    python dashboard_query_count_test.py --registrations 200 --repeats 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from pymongo import MongoClient, monitoring
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+sys.path.append(BACKEND_DIR)
+load_dotenv(os.path.join(BACKEND_DIR, ".env"))
+
+RUN_TAG = f"dashcount_{uuid.uuid4().hex[:8]}"
+READ_COMMANDS = {"find", "aggregate", "count", "getMore"}
+
+
+class ReadCounter(monitoring.CommandListener):
+    """Counts read commands against the scratch database"""
+
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        if event.database_name == RUN_TAG and event.command_name in READ_COMMANDS:
+            self.commands.append((event.command_name, event.command.get(event.command_name)))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Must be registered before the server module creates its MongoClient
+counter = ReadCounter()
+monitoring.register(counter)
+
+import server_backup  # noqa: E402
+from dashboard_cache import invalidate_dashboard  # noqa: E402
+from load_benchmark import percentile  # noqa: E402
+
+USER_ID = f"{RUN_TAG}_user"
+
+
+def seed(db, registrations: int):
+    now = datetime.utcnow()
+    tournaments, rows, matches = [], [], []
+    for n in range(registrations):
+        tournament_id = f"{RUN_TAG}_t_{n}"
+        tournaments.append({
+            "tournament_id": tournament_id,
+            "name": f"Tournament {n}",
+            "status": "completed",
+            "prize_pool": 1000.0,
+            "current_participants": 48,
+            "max_participants": 50,
+            "start_time": now - timedelta(days=n),
+            "created_at": now - timedelta(days=n + 1)
+        })
+        rows.append({
+            "registration_id": str(uuid.uuid4()),
+            "tournament_id": tournament_id,
+            "user_id": USER_ID,
+            "registered_at": now - timedelta(days=n + 1),
+            "status": "confirmed"
+        })
+        matches.append({
+            "match_id": str(uuid.uuid4()),
+            "tournament_id": tournament_id,
+            "user_id": USER_ID,
+            "placement": n % 50 + 1,
+            "earnings": 10.0 if n % 10 == 0 else 0.0,
+            "match_date": now - timedelta(days=n)
+        })
+    db.tournaments.insert_many(tournaments)
+    db.registrations.insert_many(rows)
+    db.matches.insert_many(matches)
+    db.leaderboards.insert_one({"user_id": USER_ID, "rank": 7, "points": 5000})
+    server_backup.ensure_indexes(db)
+
+
+def legacy_summary(user_id: str):
+    """The handler before batching: a find_one per recent tournament and per match result"""
+    user_registrations = list(server_backup.registrations_collection.find({"user_id": user_id}))
+    user_matches = list(server_backup.matches_collection.find({"user_id": user_id}).sort("match_date", -1))
+    total_winnings = sum(match.get("earnings", 0) for match in user_matches)
+    server_backup.leaderboards_collection.find_one({"user_id": user_id})
+    recent = []
+    for reg in user_registrations[-5:]:
+        tournament = server_backup.tournaments_collection.find_one({"tournament_id": reg["tournament_id"]})
+        if tournament:
+            server_backup.matches_collection.find_one({"user_id": user_id, "tournament_id": reg["tournament_id"]})
+            recent.append(tournament["tournament_id"])
+    return len(user_registrations), total_winnings, recent
+
+
+# One loop for every run, so its executor threads are reused as they are in the server
+loop = asyncio.new_event_loop()
+
+
+def batched_summary(user_id: str, cached: bool):
+    if not cached:
+        invalidate_dashboard(user_id)
+    return loop.run_until_complete(server_backup.load_dashboard_summary(user_id))
+
+
+def measure(fn, repeats: int):
+    counter.commands.clear()
+    result = fn()
+    commands = list(counter.commands)
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return commands, result, samples
+
+
+def check(name: str, passed: bool, detail: str) -> bool:
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assert query count and latency of GET /api/dashboard-data")
+    parser.add_argument("--registrations", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    client = MongoClient(os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db"))
+    db = client[RUN_TAG]
+    # Point the handler at the scratch database
+    server_backup.registrations_collection = db.registrations
+    server_backup.tournaments_collection = db.tournaments
+    server_backup.matches_collection = db.matches
+    server_backup.leaderboards_collection = db.leaderboards
+    seed(db, args.registrations)
+
+    results = []
+    try:
+        legacy_commands, legacy, legacy_samples = measure(lambda: legacy_summary(USER_ID), args.repeats)
+        cold_commands, summary, cold_samples = measure(lambda: batched_summary(USER_ID, cached=False), args.repeats)
+        warm_commands, _, warm_samples = measure(lambda: batched_summary(USER_ID, cached=True), args.repeats)
+
+        print(f"📊 {args.registrations} registrations, {args.repeats} runs each")
+        for name, commands, samples in (
+            ("legacy", legacy_commands, legacy_samples),
+            ("batched", cold_commands, cold_samples),
+            ("cached", warm_commands, warm_samples),
+        ):
+            print(f"   {name:8} queries={len(commands):3}  p50={percentile(samples, 50):7.2f}ms  p99={percentile(samples, 99):7.2f}ms")
+
+        results.append(check("batched queries", len(cold_commands) <= 4, f"{len(cold_commands)} queries {cold_commands}"))
+        results.append(check("cached queries", len(warm_commands) == 0, f"{len(warm_commands)} queries"))
+        results.append(check("same totals", (summary["tournaments_joined"], summary["total_winnings"]) == legacy[:2],
+                             f"joined={summary['tournaments_joined']} winnings={summary['total_winnings']}"))
+        recent_ids = [t["id"] for t in summary["recent_tournaments"]]
+        results.append(check("recent tournaments", recent_ids == [f"{RUN_TAG}_t_{n}" for n in range(min(5, args.registrations))],
+                             f"{len(recent_ids)} newest first"))
+        results.append(check("match results joined", all("result" in t for t in summary["recent_tournaments"]),
+                             f"rank={summary['current_rank']}"))
+    finally:
+        loop.close()
+        client.drop_database(RUN_TAG)
+
+    print(f"📊 {sum(results)}/{len(results)} checks passed")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
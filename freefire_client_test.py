@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Free Fire Client Cache Testing
+Drives backend/freefire_client.py against a mocked region-info-api (no network)
+with short cache TTLs and checks the positive, negative and stale caches.
+
+Usage:
+    python freefire_client_test.py
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+
+# Short TTLs so expiry can be observed; must be set before the client module is imported
+os.environ["FREE_FIRE_CACHE_TTL_SECONDS"] = "0.1"
+os.environ["FREE_FIRE_NEGATIVE_CACHE_TTL_SECONDS"] = "0.1"
+os.environ["FREE_FIRE_STALE_TTL_SECONDS"] = "60"
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+import freefire_client  # noqa: E402
+
+UID, REGION = "123456789", "ind"
+PLAYER_PAYLOAD = {"player_info": {"basicInfo": {"nickname": "Tester", "level": 50}}}
+
+
+class MockUpstream:
+    """Answers /player-info with a profile until `exists` is switched off, then 404"""
+
+    def __init__(self):
+        self.exists = True
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.exists:
+            return httpx.Response(200, json=PLAYER_PAYLOAD)
+        return httpx.Response(404, json={"error": "Player not found"})
+
+
+def check(name: str, passed: bool, detail: str = "") -> bool:
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+async def settle():
+    """Wait for background revalidations started by the last call"""
+    while freefire_client._in_flight:
+        await asyncio.sleep(0.01)
+
+
+async def run() -> bool:
+    upstream = MockUpstream()
+    freefire_client._client = httpx.AsyncClient(base_url=freefire_client.FREE_FIRE_API_BASE, transport=httpx.MockTransport(upstream))
+    ttl = freefire_client.FREE_FIRE_CACHE_TTL_SECONDS
+    results = []
+    try:
+        player = await freefire_client.validate_free_fire_uid(UID, REGION)
+        results.append(check("valid uid", player is not None and player["nickname"] == "Tester", f"player={player}"))
+
+        # Fresh entry expired: the stale copy answers while a background lookup revalidates
+        upstream.exists = False
+        await asyncio.sleep(ttl * 1.5)
+        player = await freefire_client.validate_free_fire_uid(UID, REGION)
+        results.append(check("stale served", player is not None, "last-known-good profile while revalidating"))
+        await settle()
+
+        player = await freefire_client.validate_free_fire_uid(UID, REGION)
+        results.append(check("definitive miss", player is None, f"upstream calls={upstream.calls}"))
+
+        # Negative entry expired: the old profile must not come back from the stale store
+        await asyncio.sleep(ttl * 1.5)
+        player = await freefire_client.validate_free_fire_uid(UID, REGION)
+        await settle()
+        results.append(check("miss survives negative TTL", player is None, f"player={player}"))
+    finally:
+        await freefire_client.close_http_client()
+
+    print(f"📊 {sum(results)}/{len(results)} checks passed")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(run()) else 1)
@@ -61,6 +61,25 @@ const Home = () => {
     // Removed auto-refresh interval as requested
   }, []);
 
+  // Live stats are pushed by the server; the initial values come from loadLiveStats
+  useEffect(() => {
+    const fieldMap = {
+      total_tournaments: 'totalTournaments',
+      total_prize_pool: 'totalPrizePool',
+      active_players: 'activePlayers',
+      live_matches: 'liveMatches'
+    };
+
+    return apiService.subscribeLiveStats((message) => {
+      if (message.type === 'heartbeat') return;
+      const changes = {};
+      Object.entries(message.data || {}).forEach(([key, value]) => {
+        if (fieldMap[key]) changes[fieldMap[key]] = value || 0;
+      });
+      setLiveStats(prev => ({ ...prev, ...changes }));
+    });
+  }, []);
+
   // Auto-advance for mobile only as requested by user
   // Desktop will remain manual navigation only
   const [isMobile, setIsMobile] = useState(false);
@@ -130,6 +130,42 @@ class ApiService {
     return await this.makeRequest('/api/live-stats');
   }
 
+  // Live statistics push channel: onMessage receives {type, data} where data holds only changed fields.
+  // Reconnects with backoff; returns a function that closes the subscription.
+  subscribeLiveStats(onMessage) {
+    const url = `${this.baseURL.replace(/^http/, 'ws')}/api/ws/live-stats`;
+    let socket = null;
+    let retryDelay = 1000;
+    let retryTimer = null;
+    let closed = false;
+
+    const connect = () => {
+      socket = new WebSocket(url);
+      socket.onopen = () => {
+        retryDelay = 1000;
+      };
+      socket.onmessage = (event) => {
+        try {
+          onMessage(JSON.parse(event.data));
+        } catch (error) {
+          console.error('Invalid live stats message:', error);
+        }
+      };
+      socket.onclose = () => {
+        if (closed) return;
+        retryTimer = setTimeout(connect, retryDelay);
+        retryDelay = Math.min(retryDelay * 2, 30000);
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (socket) socket.close();
+    };
+  }
+
   // Dashboard data
   async getDashboardData() {
     return await this.makeRequest('/api/dashboard-data');
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Leaderboard Query Count Test
+Calls the legacy server's get_leaderboards handler against a scratch database
+and counts the MongoDB commands it issues, to guard against the per-row user
+lookup (N+1) coming back.
+
+Usage:
+    python leaderboard_query_count_test.py --rows 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import uuid
+from datetime import datetime
+
+from dotenv import load_dotenv
+from pymongo import MongoClient, monitoring
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+sys.path.append(BACKEND_DIR)
+load_dotenv(os.path.join(BACKEND_DIR, ".env"))
+
+RUN_TAG = f"lbcount_{uuid.uuid4().hex[:8]}"
+READ_COMMANDS = {"find", "aggregate", "count", "getMore"}
+
+
+class ReadCounter(monitoring.CommandListener):
+    """Counts read commands against the scratch database"""
+
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        if event.database_name == RUN_TAG and event.command_name in READ_COMMANDS:
+            self.commands.append((event.command_name, event.command.get(event.command_name)))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+# Must be registered before the server module creates its MongoClient
+counter = ReadCounter()
+monitoring.register(counter)
+
+import server_backup  # noqa: E402
+from leaderboard_profiles import sync_leaderboard_profiles  # noqa: E402
+
+
+def seed(db, rows: int):
+    now = datetime.utcnow()
+    users, entries = [], []
+    for n in range(rows):
+        user_id = f"{RUN_TAG}_user_{n}"
+        users.append({
+            "user_id": user_id,
+            "email": f"{user_id}@example.com",
+            "free_fire_uid": f"{RUN_TAG}_{n}",
+            "free_fire_data": {"level": 40 + n % 20, "profile_pic": f"avatar-{n}"},
+            "created_at": now
+        })
+        entries.append({
+            "rank": n + 1,
+            "user_id": user_id,
+            "username": f"PLAYER_{n}",
+            "full_name": f"Player {n}",
+            "points": 10000 - n,
+            "created_at": now,
+            "updated_at": now
+        })
+    # A deleted player's row that already carries profile fields; the sync must still remove it
+    entries.append({
+        "rank": rows + 1,
+        "user_id": f"{RUN_TAG}_deleted",
+        "points": 0,
+        "level": 1,
+        "avatar": "avatar-deleted",
+        "created_at": now,
+        "updated_at": now
+    })
+    db.users.insert_many(users)
+    db.leaderboards.insert_many(entries)
+
+
+def count_reads(limit: int):
+    counter.commands.clear()
+    response = asyncio.run(server_backup.get_leaderboards(limit=limit))
+    return list(counter.commands), response
+
+
+def check(name: str, passed: bool, detail: str) -> bool:
+    print(f"{'✅' if passed else '❌'} {name}: {detail}")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assert query count of GET /api/leaderboards")
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+
+    client = MongoClient(os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db"))
+    db = client[RUN_TAG]
+    # Point the handler at the scratch database
+    server_backup.users_collection = db.users
+    server_backup.leaderboards_collection = db.leaderboards
+    seed(db, args.rows)
+
+    results = []
+    try:
+        # Rows without denormalized profiles: one leaderboard read plus one batched user fetch
+        commands, response = count_reads(args.rows)
+        results.append(check("unsynced rows", len(commands) <= 2, f"{len(commands)} queries {commands}"))
+        results.append(check("unsynced rows returned", len(response["leaderboard"]) == args.rows, f"{len(response['leaderboard'])} rows"))
+
+        totals = sync_leaderboard_profiles(db)
+        results.append(check("deleted user's row removed", db.leaderboards.count_documents({"user_id": f"{RUN_TAG}_deleted"}) == 0,
+                             f"updated={totals['updated']} removed={totals['removed']}"))
+
+        # After the background sync: a single query
+        commands, response = count_reads(args.rows)
+        results.append(check("synced rows", len(commands) == 1, f"{len(commands)} queries {commands}"))
+        first = response["leaderboard"][0]
+        results.append(check("profile fields", first["level"] == 40 and first["avatar"] == "avatar-0", f"level={first['level']} avatar={first['avatar']}"))
+    finally:
+        client.drop_database(RUN_TAG)
+
+    print(f"📊 {sum(results)}/{len(results)} checks passed")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Live Stats Broadcast Benchmark
+Measures how long a live-stats change takes to reach every subscriber as the
+subscriber count grows.
+
+In-process mode (default) drives the backend broadcaster directly with one
+consumer task per subscriber, isolating fan-out and scheduling cost.
+Socket mode (--url) opens real WebSocket connections to a running server and
+measures delivery latency from each message's sent_at stamp; run the server
+with a short LIVE_STATS_HEARTBEAT_SECONDS so there is steady traffic to sample.
+
+Usage:
+    python live_stats_broadcast_benchmark.py --subscribers 100 1000 5000 10000
+    python live_stats_broadcast_benchmark.py --url ws://localhost:8001/api/ws/live-stats --subscribers 1000 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from live_stats_broadcast import LiveStatsBroadcaster  # noqa: E402
+from load_benchmark import percentile  # noqa: E402
+
+
+async def bench_in_process(subscriber_count: int, rounds: int, slow_fraction: float):
+    broadcaster = LiveStatsBroadcaster(max_subscribers=subscriber_count)
+    latencies = []
+    received = [0]
+
+    async def consume(subscription, slow: bool):
+        while True:
+            message = await subscription.next()
+            latencies.append((time.time() - message["sent_at"]) * 1000)
+            received[0] += 1
+            if slow:
+                # A client that can't keep up: its pending updates are merged, not queued
+                await asyncio.sleep(0.05)
+
+    slow_every = int(1 / slow_fraction) if slow_fraction else 0
+    consumers = [
+        asyncio.create_task(consume(broadcaster.subscribe(), bool(slow_every) and n % slow_every == 0))
+        for n in range(subscriber_count)
+    ]
+    await asyncio.sleep(0)
+
+    fanout_ms = []
+    stats = {"total_tournaments": 0, "active_players": 0, "live_matches": 0, "total_prize_pool": 0}
+    for round_number in range(rounds):
+        stats = {**stats, "live_matches": round_number + 1}
+        broadcaster.publish(stats)
+        fanout_ms.append(broadcaster.last_fanout_seconds * 1000)
+        # Let every consumer drain before the next change
+        await asyncio.sleep(0.01)
+
+    await asyncio.sleep(0.1)
+    for consumer in consumers:
+        consumer.cancel()
+    await asyncio.gather(*consumers, return_exceptions=True)
+    return latencies, fanout_ms, broadcaster.stats()["coalesced_messages"], received[0]
+
+
+async def bench_sockets(url: str, subscriber_count: int, duration: float):
+    import websockets
+
+    latencies = []
+    rejected = [0]
+
+    async def client():
+        try:
+            async with websockets.connect(url, max_queue=4) as socket:
+                deadline = time.time() + duration
+                while time.time() < deadline:
+                    try:
+                        raw = await asyncio.wait_for(socket.recv(), timeout=max(0.1, deadline - time.time()))
+                    except asyncio.TimeoutError:
+                        break
+                    latencies.append((time.time() - json.loads(raw)["sent_at"]) * 1000)
+        except Exception:
+            rejected[0] += 1
+
+    await asyncio.gather(*(client() for _ in range(subscriber_count)))
+    return latencies, rejected[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live-stats broadcast latency vs subscriber count")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[100, 1000, 5000, 10000])
+    parser.add_argument("--rounds", type=int, default=50, help="in-process: changes to broadcast")
+    parser.add_argument("--slow-fraction", type=float, default=0.01, help="in-process: share of slow consumers")
+    parser.add_argument("--url", help="WebSocket URL of a running server (socket mode)")
+    parser.add_argument("--duration", type=float, default=30, help="socket mode: seconds to listen")
+    args = parser.parse_args()
+
+    print(f"🚀 Live stats broadcast benchmark ({'sockets: ' + args.url if args.url else 'in-process'})")
+    for count in args.subscribers:
+        if args.url:
+            latencies, rejected = asyncio.run(bench_sockets(args.url, count, args.duration))
+            extra = f"messages={len(latencies)}  failed_connections={rejected}"
+        else:
+            latencies, fanout_ms, coalesced, received = asyncio.run(
+                bench_in_process(count, args.rounds, args.slow_fraction)
+            )
+            extra = (
+                f"fan-out p50={percentile(fanout_ms, 50):6.2f}ms  "
+                f"delivered={received}  coalesced={coalesced}"
+            )
+        if not latencies:
+            print(f"❌ {count:>6} subscribers: no messages received")
+            continue
+        print(
+            f"📊 {count:>6} subscribers  delivery p50={percentile(latencies, 50):7.2f}ms  "
+            f"p99={percentile(latencies, 99):7.2f}ms  max={max(latencies):7.2f}ms  {extra}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Load Benchmark for Tournament Platform API
+Fires concurrent clients at read endpoints and reports p50/p99 latency,
+optionally comparing a baseline server against a candidate server.
+
+Usage:
+    python load_benchmark.py --candidate http://localhost:8001 --baseline http://localhost:8002
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/api/tournaments",
+    "/api/leaderboards",
+    "/api/live-stats",
+]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples (pct in 0-100)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_load(
+    base_url: str,
+    paths: List[str],
+    concurrency: int,
+    requests_per_client: int,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, float]:
+    """Run `concurrency` clients, each issuing `requests_per_client` sequential requests"""
+    latencies: List[float] = []
+    errors = 0
+    start_gate = asyncio.Event()
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits, headers=headers) as client:
+
+        async def worker(worker_id: int):
+            nonlocal errors
+            await start_gate.wait()
+            for i in range(requests_per_client):
+                path = paths[(worker_id + i) % len(paths)]
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        tasks = [asyncio.create_task(worker(n)) for n in range(concurrency)]
+        wall_start = time.perf_counter()
+        start_gate.set()
+        await asyncio.gather(*tasks)
+        wall_time = time.perf_counter() - wall_start
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies) if latencies else 0.0,
+        "throughput_rps": len(latencies) / wall_time if wall_time else 0.0,
+    }
+
+
+def print_report(label: str, result: Dict[str, float]):
+    print(
+        f"{label:<10} requests={result['requests']:<6} errors={result['errors']:<5} "
+        f"p50={result['p50_ms']:8.1f}ms  p99={result['p99_ms']:8.1f}ms  "
+        f"max={result['max_ms']:8.1f}ms  rps={result['throughput_rps']:8.1f}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Latency benchmark under concurrent load")
+    parser.add_argument("--candidate", default="http://localhost:8001", help="Server under test")
+    parser.add_argument("--baseline", default=None, help="Optional server to compare against")
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests-per-client", type=int, default=10)
+    parser.add_argument("--path", action="append", dest="paths", help="Endpoint path (repeatable)")
+    parser.add_argument("--token", default=None, help="Bearer token for authenticated paths")
+    args = parser.parse_args()
+
+    paths = args.paths or DEFAULT_PATHS
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else None
+
+    print(f"🚀 {args.concurrency} concurrent clients x {args.requests_per_client} requests over {paths}")
+
+    results = {}
+    targets = [("candidate", args.candidate)]
+    if args.baseline:
+        targets.insert(0, ("baseline", args.baseline))
+
+    for label, url in targets:
+        results[label] = await run_load(url, paths, args.concurrency, args.requests_per_client, headers)
+        print_report(label, results[label])
+
+    if "baseline" in results:
+        baseline, candidate = results["baseline"], results["candidate"]
+        for key in ("p50_ms", "p99_ms"):
+            if candidate[key]:
+                print(f"📊 {key}: {baseline[key] / candidate[key]:.2f}x (baseline / candidate)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Pagination Benchmark - skip/limit vs keyset cursor
+Seeds enough tournaments into a scratch database to reach a deep page, then
+times fetching that page both ways and reports documents examined.
+
+Usage:
+    python pagination_benchmark.py --page 500 --page-size 20
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from pagination import KEYSET_SORT, apply_cursor, encode_cursor  # noqa: E402
+from indexes import ensure_indexes  # noqa: E402
+from load_benchmark import percentile  # noqa: E402
+
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", ".env"))
+
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db")
+RUN_TAG = f"pagebench_{uuid.uuid4().hex[:8]}"
+
+
+def seed(collection, count: int):
+    now = datetime.utcnow()
+    batch = []
+    for n in range(count):
+        batch.append({
+            "tournament_id": f"{RUN_TAG}_{n}",
+            "name": f"Pagination Bench {n}",
+            "game_type": "free_fire",
+            "status": "upcoming",
+            "country": "India",
+            "entry_fee": 0,
+            "prize_pool": 0,
+            "max_participants": 100,
+            "current_participants": 0,
+            # Every 10 share a timestamp so the _id tie-breaker is exercised
+            "created_at": now - timedelta(seconds=n // 10),
+            "updated_at": now
+        })
+        if len(batch) == 5000:
+            collection.insert_many(batch)
+            batch = []
+    if batch:
+        collection.insert_many(batch)
+
+
+def time_query(make_cursor, repeats: int):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        documents = list(make_cursor())
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, documents
+
+
+def docs_examined(cursor) -> int:
+    return cursor.explain().get("executionStats", {}).get("totalDocsExamined", -1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deep-page latency: skip vs keyset cursor")
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    client = MongoClient(MONGO_URL)
+    db = client[RUN_TAG]
+    tournaments = db.tournaments
+    ensure_indexes(db)
+
+    # Same shape as an unfiltered /api/tournaments listing
+    query = {}
+    total = (args.page + 1) * args.page_size
+    print(f"🌱 Seeding {total} tournaments into scratch database {RUN_TAG}")
+    seed(tournaments, total)
+
+    try:
+        skip = (args.page - 1) * args.page_size
+
+        # Cursor for the page: the last document of the previous page
+        previous_last = list(tournaments.find(query).sort(KEYSET_SORT).skip(skip - 1).limit(1))[0]
+        keyset_query = apply_cursor(query, encode_cursor(previous_last))
+
+        skip_samples, skip_docs = time_query(
+            lambda: tournaments.find(query).sort(KEYSET_SORT).skip(skip).limit(args.page_size), args.repeats
+        )
+        keyset_samples, keyset_docs = time_query(
+            lambda: tournaments.find(keyset_query).sort(KEYSET_SORT).limit(args.page_size), args.repeats
+        )
+
+        assert [d["_id"] for d in skip_docs] == [d["_id"] for d in keyset_docs], "Pages differ between strategies"
+
+        skip_examined = docs_examined(tournaments.find(query).sort(KEYSET_SORT).skip(skip).limit(args.page_size))
+        keyset_examined = docs_examined(tournaments.find(keyset_query).sort(KEYSET_SORT).limit(args.page_size))
+
+        print(f"📊 page {args.page} x {args.page_size}")
+        print(f"   skip    p50={percentile(skip_samples, 50):7.2f}ms  p99={percentile(skip_samples, 99):7.2f}ms  docs_examined={skip_examined}")
+        print(f"   keyset  p50={percentile(keyset_samples, 50):7.2f}ms  p99={percentile(keyset_samples, 99):7.2f}ms  docs_examined={keyset_examined}")
+        print("✅ Both strategies return the same page")
+    finally:
+        client.drop_database(RUN_TAG)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Payload Size Regression Testing
+Checks that list endpoints of a running backend send card-level documents,
+honour the `fields=` sparse fieldset, and stay under per-item byte budgets.
+
+Usage:
+    python payload_size_test.py --url http://localhost:8001 [--token <jwt>]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from projections import TOURNAMENT_FIELDS, TRANSACTION_FIELDS, KEYSET_FIELDS  # noqa: E402
+
+# Bytes per serialized list item; raise deliberately when a card gains a field
+TOURNAMENT_CARD_BUDGET = 700
+TOURNAMENT_SPARSE_BUDGET = 240
+TRANSACTION_BUDGET = 400
+
+
+class PayloadSizeTester:
+    def __init__(self, base_url: str, token: str = None):
+        self.api_url = f"{base_url.rstrip('/')}/api"
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.results = {"total_tests": 0, "passed": 0, "failed": 0, "errors": []}
+
+    def log_result(self, test_name: str, success: bool, message: str = ""):
+        self.results["total_tests"] += 1
+        if success:
+            self.results["passed"] += 1
+            print(f"✅ {test_name}: PASSED {message}")
+        else:
+            self.results["failed"] += 1
+            self.results["errors"].append(f"{test_name}: {message}")
+            print(f"❌ {test_name}: FAILED {message}")
+
+    @staticmethod
+    def per_item(items) -> float:
+        return max(len(json.dumps(item, separators=(",", ":")).encode()) for item in items) if items else 0
+
+    def test_tournament_cards(self):
+        response = requests.get(f"{self.api_url}/tournaments?limit=20", timeout=10)
+        tournaments = response.json().get("tournaments", [])
+        if not tournaments:
+            self.log_result("tournament cards", False, "no tournaments to measure; seed the database first")
+            return
+        extra = {key for t in tournaments for key in t} - set(TOURNAMENT_FIELDS) - set(KEYSET_FIELDS)
+        self.log_result("tournament card keys", not extra and all("participants" not in t for t in tournaments),
+                        f"unexpected={sorted(extra)}")
+        size = self.per_item(tournaments)
+        self.log_result("tournament card size", size <= TOURNAMENT_CARD_BUDGET,
+                        f"largest={size}B budget={TOURNAMENT_CARD_BUDGET}B total={len(response.content)}B")
+
+    def test_sparse_fieldset(self):
+        response = requests.get(f"{self.api_url}/tournaments?limit=20&fields=tournament_id,name,status", timeout=10)
+        tournaments = response.json().get("tournaments", [])
+        keys = {key for t in tournaments for key in t}
+        self.log_result("sparse fieldset keys", keys <= {"tournament_id", "name", "status", *KEYSET_FIELDS},
+                        f"keys={sorted(keys)}")
+        size = self.per_item(tournaments)
+        self.log_result("sparse fieldset size", size <= TOURNAMENT_SPARSE_BUDGET,
+                        f"largest={size}B budget={TOURNAMENT_SPARSE_BUDGET}B")
+
+        rejected = requests.get(f"{self.api_url}/tournaments?fields=participants", timeout=10)
+        self.log_result("unknown field rejected", rejected.status_code == 400, f"status={rejected.status_code}")
+
+    def test_transactions(self):
+        if not self.headers:
+            print("⏭️  wallet transactions: skipped (pass --token)")
+            return
+        response = requests.get(f"{self.api_url}/wallet/transactions", headers=self.headers, timeout=10)
+        transactions = response.json().get("transactions", [])
+        extra = {key for t in transactions for key in t} - set(TRANSACTION_FIELDS)
+        self.log_result("transaction keys", response.status_code == 200 and not extra, f"unexpected={sorted(extra)}")
+        size = self.per_item(transactions)
+        self.log_result("transaction size", size <= TRANSACTION_BUDGET, f"largest={size}B budget={TRANSACTION_BUDGET}B")
+
+    def run(self) -> bool:
+        print(f"Testing payload sizes at: {self.api_url}")
+        self.test_tournament_cards()
+        self.test_sparse_fieldset()
+        self.test_transactions()
+        print(f"\n📊 {self.results['passed']}/{self.results['total_tests']} passed")
+        return self.results["failed"] == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Payload size regression tests for list endpoints")
+    parser.add_argument("--url", default="http://localhost:8001")
+    parser.add_argument("--token", help="JWT for the authenticated endpoints")
+    args = parser.parse_args()
+    sys.exit(0 if PayloadSizeTester(args.url, args.token).run() else 1)
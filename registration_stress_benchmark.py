@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tournament Registration Stress Benchmark
+Fires a burst of concurrent joins at one free tournament and checks that the
+slot reservation never oversells. Seeds its own users and tournament directly
+in MongoDB and mints tokens with the backend's JWT secret.
+
+Usage:
+    python registration_stress_benchmark.py --joins 10000 --slots 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import jwt
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+from load_benchmark import percentile
+
+load_dotenv(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", ".env"))
+
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/tournament_db")
+JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+RUN_TAG = f"stress_{uuid.uuid4().hex[:8]}"
+
+
+def seed(db, joins: int, slots: int):
+    """Insert one free tournament and `joins` throwaway users; return (tournament_id, tokens)"""
+    tournament_id = f"{RUN_TAG}_tournament"
+    now = datetime.utcnow()
+    db.tournaments.insert_one({
+        "tournament_id": tournament_id,
+        "name": f"Stress Test {RUN_TAG}",
+        "game_type": "free_fire",
+        "tournament_type": "battle_royale",
+        "entry_fee": 0,
+        "prize_pool": 0,
+        "max_participants": slots,
+        "current_participants": 0,
+        "start_time": now + timedelta(days=1),
+        "registration_deadline": now + timedelta(hours=1),
+        "mode": "solo",
+        "country": "India",
+        "status": "upcoming",
+        "stress_test": RUN_TAG,
+        "created_at": now,
+        "updated_at": now
+    })
+
+    users = [
+        {
+            "user_id": f"{RUN_TAG}_user_{n}",
+            "email": f"{RUN_TAG}_{n}@stress.test",
+            "username": f"stress{n}",
+            "full_name": f"Stress User {n}",
+            "free_fire_uid": f"{RUN_TAG}_{n}",
+            "wallet_balance": 0,
+            "is_verified": True,
+            "is_admin": False,
+            "stress_test": RUN_TAG,
+            "created_at": now
+        }
+        for n in range(joins)
+    ]
+    db.users.insert_many(users)
+
+    expire = now + timedelta(hours=1)
+    tokens = [jwt.encode({"sub": user["user_id"], "exp": expire}, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM) for user in users]
+    return tournament_id, tokens
+
+
+def cleanup(db, tournament_id: str):
+    db.registrations.delete_many({"tournament_id": tournament_id})
+    db.tournaments.delete_many({"stress_test": RUN_TAG})
+    db.users.delete_many({"stress_test": RUN_TAG})
+
+
+async def fire_joins(base_url: str, tournament_id: str, tokens, concurrency: int):
+    latencies = []
+    outcomes = {"registered": 0, "full": 0, "other": 0}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=limits) as client:
+
+        async def join(token: str):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        f"/api/tournaments/{tournament_id}/register",
+                        headers={"Authorization": f"Bearer {token}", "Idempotency-Key": uuid.uuid4().hex}
+                    )
+                    if response.status_code == 200:
+                        outcomes["registered"] += 1
+                    elif "full" in response.text.lower():
+                        outcomes["full"] += 1
+                    else:
+                        outcomes["other"] += 1
+                except httpx.HTTPError:
+                    outcomes["other"] += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(join(token) for token in tokens))
+        wall_time = time.perf_counter() - wall_start
+
+    return outcomes, latencies, wall_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent tournament join stress test")
+    parser.add_argument("--url", default="http://localhost:8001")
+    parser.add_argument("--joins", type=int, default=10000)
+    parser.add_argument("--slots", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--keep", action="store_true", help="Don't delete seeded data afterwards")
+    args = parser.parse_args()
+
+    if not JWT_SECRET_KEY:
+        print("❌ JWT_SECRET_KEY not found in backend/.env")
+        sys.exit(1)
+
+    db = MongoClient(MONGO_URL).tournament_db
+    print(f"🌱 Seeding {args.joins} users and a {args.slots}-slot tournament ({RUN_TAG})")
+    tournament_id, tokens = seed(db, args.joins, args.slots)
+
+    try:
+        print(f"🚀 Firing {args.joins} joins with concurrency {args.concurrency}")
+        outcomes, latencies, wall_time = asyncio.run(fire_joins(args.url, tournament_id, tokens, args.concurrency))
+
+        tournament = db.tournaments.find_one({"tournament_id": tournament_id})
+        registrations = db.registrations.count_documents({"tournament_id": tournament_id})
+
+        print(f"📊 outcomes={outcomes}")
+        print(f"📊 throughput={len(latencies) / wall_time:.1f} joins/s  "
+              f"p50={percentile(latencies, 50):.1f}ms  p99={percentile(latencies, 99):.1f}ms")
+        print(f"📊 current_participants={tournament['current_participants']}  "
+              f"registrations={registrations}  max_participants={args.slots}")
+
+        assert registrations <= args.slots, "Oversold: more registrations than slots"
+        assert tournament["current_participants"] == registrations, "Counter drifted from registrations"
+        assert outcomes["registered"] == registrations, "Successful responses don't match stored registrations"
+        print("✅ No overselling detected")
+    finally:
+        if not args.keep:
+            cleanup(db, tournament_id)
+
+
+if __name__ == "__main__":
+    main()
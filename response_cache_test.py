@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Response Cache Testing
+Checks ETag / If-None-Match handling and cache hits on the public read
+endpoints of a running backend.
+
+Usage:
+    python response_cache_test.py --url http://localhost:8001
+"""
+
+import argparse
+import sys
+
+import requests
+
+CACHED_ENDPOINTS = [
+    "/api/tournaments?limit=20",
+    "/api/leaderboards?limit=50",
+    "/api/live-stats",
+]
+
+
+class ResponseCacheTester:
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self.results = {"total_tests": 0, "passed": 0, "failed": 0, "errors": []}
+
+    def log_result(self, test_name: str, success: bool, message: str = ""):
+        self.results["total_tests"] += 1
+        if success:
+            self.results["passed"] += 1
+            print(f"✅ {test_name}: PASSED {message}")
+        else:
+            self.results["failed"] += 1
+            self.results["errors"].append(f"{test_name}: {message}")
+            print(f"❌ {test_name}: FAILED {message}")
+
+    def test_endpoint(self, endpoint: str):
+        url = f"{self.base_url}{endpoint}"
+        first = requests.get(url, timeout=10)
+        etag = first.headers.get("ETag")
+        self.log_result(f"{endpoint} ETag", first.status_code == 200 and bool(etag) and not etag.startswith("W/"),
+                        f"status={first.status_code} etag={etag}")
+        if not etag:
+            return
+
+        second = requests.get(url, timeout=10)
+        self.log_result(f"{endpoint} cache hit", second.headers.get("X-Cache") == "HIT" and second.content == first.content,
+                        f"X-Cache={second.headers.get('X-Cache')}")
+
+        revalidated = requests.get(url, headers={"If-None-Match": etag}, timeout=10)
+        self.log_result(f"{endpoint} 304", revalidated.status_code == 304 and not revalidated.content,
+                        f"status={revalidated.status_code} bytes={len(revalidated.content)}")
+
+        mismatched = requests.get(url, headers={"If-None-Match": '"stale"'}, timeout=10)
+        self.log_result(f"{endpoint} stale ETag", mismatched.status_code == 200 and mismatched.content,
+                        f"status={mismatched.status_code}")
+
+    def test_param_normalization(self):
+        a = requests.get(f"{self.base_url}/api/tournaments?limit=5&status=", timeout=10)
+        b = requests.get(f"{self.base_url}/api/tournaments?limit=5", timeout=10)
+        self.log_result("query normalization", a.headers.get("ETag") == b.headers.get("ETag") and b.headers.get("X-Cache") == "HIT",
+                        f"X-Cache={b.headers.get('X-Cache')}")
+
+    def run(self) -> bool:
+        print(f"Testing response cache at: {self.base_url}")
+        for endpoint in CACHED_ENDPOINTS:
+            self.test_endpoint(endpoint)
+        self.test_param_normalization()
+        print(f"\n📊 {self.results['passed']}/{self.results['total_tests']} passed")
+        return self.results["failed"] == 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Test ETag/304 response caching")
+    parser.add_argument("--url", default="http://localhost:8001")
+    args = parser.parse_args()
+    sys.exit(0 if ResponseCacheTester(args.url).run() else 1)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Participants Migration Script
+Moves tournament membership out of the embedded `participants` array on
+tournament documents into the registrations collection, which is now the only
+record of who joined what. Safe to re-run.
+
+  1. every user id in a tournament's `participants` array gets a registration
+     (existing registrations are left untouched)
+  2. registrations written with the old `registration_date` field get `registered_at`
+  3. `current_participants` is raised to the registration count where it lagged
+  4. the `participants` array is removed from every tournament
+
+Usage:
+    python scripts/migrate_participants.py [--dry-run]
+"""
+
+import os
+import sys
+import uuid
+import argparse
+from datetime import datetime
+from dotenv import load_dotenv
+from pymongo import MongoClient, UpdateOne
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+from indexes import ensure_indexes
+
+# Load environment variables
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', 'backend', '.env'))
+
+MONGO_URL = os.getenv("MONGO_URL")
+
+if not MONGO_URL:
+    print("Error: MONGO_URL not found in environment variables")
+    sys.exit(1)
+
+BATCH_SIZE = 1000
+
+
+def migrate_embedded_participants(db, dry_run: bool) -> int:
+    """Create a registration for every embedded participant that doesn't have one"""
+    print("📝 Copying embedded participants into registrations...")
+    operations = []
+    copied = 0
+    tournaments = db.tournaments.find(
+        {"participants.0": {"$exists": True}},
+        {"_id": 0, "tournament_id": 1, "participants": 1, "created_at": 1}
+    )
+    for tournament in tournaments:
+        for user_id in tournament["participants"]:
+            operations.append(UpdateOne(
+                {"tournament_id": tournament["tournament_id"], "user_id": user_id},
+                {"$setOnInsert": {
+                    "registration_id": str(uuid.uuid4()),
+                    "payment_order_id": None,
+                    "registered_at": tournament.get("created_at") or datetime.utcnow(),
+                    "status": "confirmed",
+                    "migrated_from": "participants"
+                }},
+                upsert=True
+            ))
+            if len(operations) == BATCH_SIZE:
+                copied += _flush(db.registrations, operations, dry_run)
+                operations = []
+    if operations:
+        copied += _flush(db.registrations, operations, dry_run)
+    if dry_run:
+        print(f"  ✅ {copied} embedded participants to copy (already-registered ones will be skipped)")
+    else:
+        print(f"  ✅ {copied} registrations created")
+    return copied
+
+
+def _flush(collection, operations, dry_run: bool) -> int:
+    if dry_run:
+        return len(operations)
+    # Upserts keyed on the unique (tournament_id, user_id) index: existing rows are untouched
+    return collection.bulk_write(operations, ordered=False).upserted_count
+
+
+def backfill_registered_at(db, dry_run: bool) -> int:
+    print("🕒 Backfilling registered_at on legacy registrations...")
+    query = {"registered_at": {"$exists": False}, "registration_date": {"$exists": True}}
+    if dry_run:
+        count = db.registrations.count_documents(query)
+    else:
+        count = db.registrations.update_many(query, [
+            {"$set": {"registered_at": "$registration_date"}},
+            {"$unset": "registration_date"}
+        ]).modified_count
+    print(f"  ✅ {count} registrations {'would be ' if dry_run else ''}updated")
+    return count
+
+
+def reconcile_participant_counts(db, dry_run: bool) -> int:
+    """Raise current_participants where it's below the registration count (never lowers it)"""
+    print("🔢 Reconciling current_participants with registrations...")
+    registered = {
+        row["_id"]: row["registered"]
+        for row in db.registrations.aggregate([{"$group": {"_id": "$tournament_id", "registered": {"$sum": 1}}}])
+    }
+    lagging = [
+        tournament for tournament in db.tournaments.find(
+            {"tournament_id": {"$in": list(registered)}},
+            {"_id": 0, "tournament_id": 1, "current_participants": 1}
+        )
+        if tournament.get("current_participants", 0) < registered[tournament["tournament_id"]]
+    ]
+    fixed = len(lagging)
+    if lagging and not dry_run:
+        # The filter repeats the check so a concurrent join between read and write isn't overwritten
+        fixed = db.tournaments.bulk_write([
+            UpdateOne(
+                {"tournament_id": t["tournament_id"], "current_participants": {"$lt": registered[t["tournament_id"]]}},
+                {"$set": {"current_participants": registered[t["tournament_id"]]}}
+            )
+            for t in lagging
+        ], ordered=False).modified_count
+    print(f"  ✅ {fixed} tournaments {'would be ' if dry_run else ''}corrected")
+    return fixed
+
+
+def drop_embedded_arrays(db, dry_run: bool) -> int:
+    print("🧹 Removing participants arrays from tournaments...")
+    query = {"participants": {"$exists": True}}
+    if dry_run:
+        count = db.tournaments.count_documents(query)
+    else:
+        count = db.tournaments.update_many(query, {"$unset": {"participants": ""}}).modified_count
+    print(f"  ✅ {count} tournaments {'would be ' if dry_run else ''}updated")
+    return count
+
+
+def drop_membership_index(db, dry_run: bool):
+    """The multikey index on the old array is no longer declared; remove it from existing deployments"""
+    if "participants_created_at" in db.tournaments.index_information():
+        print("🗑️  Dropping tournaments.participants_created_at index...")
+        if not dry_run:
+            db.tournaments.drop_index("participants_created_at")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move tournament participants into registrations")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    args = parser.parse_args()
+
+    print("🚀 Starting participants migration..." + (" (dry run)" if args.dry_run else ""))
+    print("="*60)
+
+    client = MongoClient(MONGO_URL)
+    db = client.tournament_db
+
+    try:
+        # The upserts rely on the unique (tournament_id, user_id) registration index
+        if not args.dry_run:
+            ensure_indexes(db)
+        migrate_embedded_participants(db, args.dry_run)
+        backfill_registered_at(db, args.dry_run)
+        reconcile_participant_counts(db, args.dry_run)
+        drop_embedded_arrays(db, args.dry_run)
+        drop_membership_index(db, args.dry_run)
+    except Exception as e:
+        print(f"❌ Error during migration: {e}")
+        return False
+
+    print("="*60)
+    print("🎉 Participants migration completed successfully!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
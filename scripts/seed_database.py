@@ -18,6 +18,9 @@ import json
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'backend'))
+from segmented_leaderboards import rebuild_segments
+
 # Load environment variables
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', 'backend', '.env'))
 
@@ -599,7 +602,7 @@ def seed_registrations_and_matches(inserted_users, inserted_tournaments):
                 "registration_id": str(uuid.uuid4()),
                 "tournament_id": tournament_id,
                 "user_id": user_id,
-                "registration_date": tournament["created_at"] + timedelta(hours=random.randint(1, 48)),
+                "registered_at": tournament["created_at"] + timedelta(hours=random.randint(1, 48)),
                 "payment_status": "completed",
                 "team_members": [],
                 "status": "confirmed"
@@ -697,6 +700,7 @@ def main():
         inserted_tournaments = seed_tournaments()
         leaderboard_count = seed_leaderboard(inserted_users)
         registration_count, match_count = seed_registrations_and_matches(inserted_users, inserted_tournaments)
+        rebuild_segments(db)
         prediction_count = seed_ai_predictions()
         update_live_stats()
         
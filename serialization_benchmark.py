@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Serialization Benchmark - tournament listing payloads
+Builds tournament documents shaped like MongoDB returns them (ObjectId, naive
+datetimes) and times turning a listing into response bytes:
+
+  before: per-document _id/isoformat fixups, then FastAPI's jsonable_encoder
+          and JSONResponse (json.dumps)
+  after:  FastJSONResponse (orjson) on the raw documents
+
+Usage:
+    python serialization_benchmark.py --tournaments 1000 --repeats 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+from serialization import FastJSONResponse  # noqa: E402
+from load_benchmark import percentile  # noqa: E402
+
+
+def make_tournaments(count: int, participants: int):
+    now = datetime.utcnow()
+    return [
+        {
+            "_id": ObjectId(),
+            "tournament_id": str(uuid.uuid4()),
+            "name": f"Free Fire Championship {n}",
+            "game_type": "free_fire",
+            "tournament_type": "battle_royale",
+            "entry_fee": 50.0,
+            "prize_pool": 10000.0,
+            "max_participants": 100,
+            "current_participants": participants,
+            "start_time": now + timedelta(days=1),
+            "registration_deadline": now + timedelta(hours=12),
+            "status": "upcoming",
+            "mode": "squad",
+            "country": "India",
+            "description": "Weekly squad tournament with cash prizes for the top three teams.",
+            "participants": [str(uuid.uuid4()) for _ in range(participants)],
+            "created_by": str(uuid.uuid4()),
+            "created_at": now - timedelta(minutes=n),
+            "updated_at": now,
+        }
+        for n in range(count)
+    ]
+
+
+def copy_documents(documents):
+    return [dict(document) for document in documents]
+
+
+def before(documents) -> bytes:
+    for tournament in documents:
+        tournament["_id"] = str(tournament["_id"])
+        tournament["start_time"] = tournament["start_time"].isoformat()
+        tournament["registration_deadline"] = tournament["registration_deadline"].isoformat()
+        tournament["created_at"] = tournament["created_at"].isoformat()
+        tournament["updated_at"] = tournament["updated_at"].isoformat()
+    content = jsonable_encoder({"tournaments": documents, "count": len(documents)})
+    return JSONResponse(content).body
+
+
+def after(documents) -> bytes:
+    return FastJSONResponse({"tournaments": documents, "count": len(documents)}).body
+
+
+def time_it(fn, documents, repeats: int):
+    samples = []
+    body = b""
+    for _ in range(repeats):
+        # Each run gets fresh dicts, as a handler would from the driver
+        batch = copy_documents(documents)
+        started = time.perf_counter()
+        body = fn(batch)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Listing serialization: jsonable_encoder+json vs orjson")
+    parser.add_argument("--tournaments", type=int, default=1000)
+    parser.add_argument("--participants", type=int, default=0, help="participant ids per embedded array")
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    documents = make_tournaments(args.tournaments, args.participants)
+    before_samples, before_body = time_it(before, documents, args.repeats)
+    after_samples, after_body = time_it(after, documents, args.repeats)
+
+    assert json.loads(before_body) == json.loads(after_body), "Serializers disagree on the payload"
+
+    print(f"📊 {args.tournaments} tournaments, {args.participants} participants each, {len(after_body):,} bytes")
+    print(f"   before  p50={percentile(before_samples, 50):8.2f}ms  p99={percentile(before_samples, 99):8.2f}ms")
+    print(f"   after   p50={percentile(after_samples, 50):8.2f}ms  p99={percentile(after_samples, 99):8.2f}ms")
+    print(f"✅ Identical JSON, {percentile(before_samples, 50) / max(percentile(after_samples, 50), 1e-6):.1f}x faster at p50")
+
+
+if __name__ == "__main__":
+    main()